@@ -7,15 +7,327 @@ import maya.cmds as mc
 import math as math
 import pymel.core.datatypes as dt
 import maya.mel as mel
+import maya.api.OpenMaya as om
 import string
 import random
+import re
+from contextlib import contextmanager
 
 obj_num_min = 3
 obj_num_max = 32
 obj_scale_min = 1.0
 obj_scale_max = 6.0
 
+# Folding pattern points of the initial 3x6 plane, in vertex ID order
+plane_vtx_order = (
+    'F8', 'G8', 'H8', 'I8',
+    'F7', 'G7', 'H7', 'I7',
+    'F6', 'G6', 'H6', 'I6',
+    'F5', 'G5', 'H5', 'I5',
+    'F3', 'G3', 'H3', 'I3',
+    'F2', 'G2', 'H2', 'I2',
+    'F1', 'G1', 'H1', 'I1'
+)
+
+# Valid colors, 1 = wrapping paper, 2 = ribbon
+color_list = {
+    1: ('green', 'red', 'blue', 'yellow', 'white', 'black'),
+    2: ('green', 'red', 'blue', 'yellow')
+}
+
+# Shader names by color, see shader_list
+shader_names = {
+    1: dict([(color, 'paper_' + color.upper()) for color in color_list[1]]),
+    2: dict([(color, 'ribbon_' + color.upper()) for color in color_list[2]])
+}
+
+# Shaders created on demand by createShaders, (name, material type, color)
+shader_list = [
+    ('ribbon_GREEN', 'blinn', (0.1, 0.6, 0.1)),
+    ('ribbon_RED', 'blinn', (0.6, 0.1, 0.1)),
+    ('ribbon_BLUE', 'blinn', (0.1, 0.1, 0.6)),
+    ('ribbon_YELLOW', 'blinn', (0.8, 0.7, 0.1)),
+    ('paper_GREEN', 'lambert', (0.2, 0.6, 0.2)),
+    ('paper_RED', 'lambert', (0.8, 0.3, 0.3)),
+    ('paper_BLUE', 'lambert', (0.3, 0.3, 0.8)),
+    ('paper_YELLOW', 'lambert', (0.8, 0.75, 0.3)),
+    ('paper_WHITE', 'lambert', (0.98, 0.98, 0.98)),
+    ('paper_BLACK', 'lambert', (0.1, 0.1, 0.1))
+]
+
+# Material settings shared by each material type, (attribute, value)
+shader_attrs = {
+    'blinn': [('eccentricity', 0.6), ('specularRollOff', 0.7)],
+    'lambert': [('diffuse', 1)]
+}
+
+# Vertex IDs of the folding pattern points once the folding plane is built,
+# False = folds don't overlap, True = overlapping folds
+fold_vtx_ids = {
+    False: {
+        # x = 8
+        'F8': 0,
+        'G8': 1,
+        'H8': 2,
+        'I8': 3,
+        # x = 7
+        'F7': 4,
+        'G7': 5,
+        'H7': 6,
+        'I7': 7,
+        # diagonal folds x = 7
+        'F7a': 35,
+        'I7a': 34,
+        # x = 6
+        'F6': 8,
+        'G6': 9,
+        'H6': 10,
+        'I6': 11,
+        # x = 5
+        'F5': 12,
+        'G5': 13,
+        'H5': 14,
+        'I5': 15,
+        # diagonal folds x = 4
+        'F4a': 31,
+        'F4b': 30,
+        'I4a': 29,
+        'I4b': 28,
+        # x = 3
+        'F3': 16,
+        'G3': 17,
+        'H3': 18,
+        'I3': 19,
+        # x = 2
+        'F2': 20,
+        'G2': 21,
+        'H2': 22,
+        'I2': 23,
+        # x = 1
+        'F1': 24,
+        'G1': 25,
+        'H1': 26,
+        'I1': 27,
+        # x = 1 diagonal folds
+        'F1a': 33,
+        'I1a': 32
+    },
+    True: {
+        # x = 7
+        'F7': 0,
+        'G7': 1,
+        'H7': 2,
+        'I7': 3,
+        # x = 7 diagonal folds
+        'F7a': 4,
+        'F7b': 37,
+        'I7a': 7,
+        'I7b': 36,
+        # x = 6
+        'F6': 8,
+        'G6': 5,
+        'H6': 6,
+        'I6': 9,
+        # x = 5
+        'F5': 10,
+        'G5': 11,
+        'H5': 12,
+        'I5': 13,
+        # x = 4
+        'FG4': 31,
+        'F4a': 29,
+        'F4b': 30,
+        'HI4': 28,
+        'I4a': 26,
+        'I4b': 27,
+        # x = 3
+        'F3': 14,
+        'G3': 15,
+        'H3': 16,
+        'I3': 17,
+        # x = 2
+        'F2': 18,
+        'G2': 19,
+        'H2': 20,
+        'I2': 21,
+        # x = 1
+        'F1': 22,
+        'G1': 23,
+        'H1': 24,
+        'I1': 25,
+        # x = 1 diagonal folds
+        'F1a': 35,
+        'F1b': 34,
+        'F1c': 38,
+        'I1a': 33,
+        'I1b': 32,
+        'I1c': 39
+    }
+}
+
+# Folding clusters in creation order, (name, rotation of the pivot locator group)
+# None = no locator, the cluster rotates around its own handle
+fold_clusters = [
+    ('1U', None),
+    ('1B', None),
+    ('2U', None),
+    ('2B', None),
+    ('3UR', (0, -45, 0)),
+    ('3BR', (180, 225, 0)),
+    ('3UL', (0, 45, 0)),
+    ('3BL', (0, 45, 180)),
+    ('4UR', (0, 135, 0)),
+    ('4BR', (0, 45, 0)),
+    ('4UL', (0, 225, 0)),
+    ('4BL', (180, 225, 180)),
+    ('6R', None),
+    ('6L', None),
+    ('5R', None),
+    ('5L', None)
+]
+
+# Folding pattern points deformed by each cluster,
+# False = folds don't overlap, True = overlapping folds
+cluster_members = {
+    False: {
+        '1U': ('F1', 'G1', 'H1', 'I1', 'F2', 'G2', 'H2', 'I2', 'F1a', 'I1a'),
+        '1B': ('F6', 'G6', 'H6', 'I6', 'F7', 'G7', 'H7', 'I7', 'F8', 'G8', 'H8', 'I8', 'F7a', 'I7a'),
+        '2U': ('F1', 'G1', 'H1', 'I1', 'F1a', 'I1a'),
+        '2B': ('F7', 'G7', 'H7', 'I7', 'F8', 'G8', 'H8', 'I8', 'F7a', 'I7a'),
+        '3UR': ('I3',),
+        '3BR': ('I5',),
+        '3UL': ('F3',),
+        '3BL': ('F5',),
+        '4UR': ('I2',),
+        '4BR': ('I6',),
+        '4UL': ('F2',),
+        '4BL': ('F6',),
+        '6R': ('I4a', 'I4b'),
+        '6L': ('F4a', 'F4b'),
+        '5R': ('I7', 'I1', 'I1a', 'I7a', 'I8'),
+        '5L': ('F7', 'F1', 'F1a', 'F7a', 'F8')
+    },
+    True: {
+        '1U': ('F1', 'G1', 'H1', 'I1', 'F2', 'G2', 'H2', 'I2', 'F1a', 'I1a', 'F1b', 'I1b', 'F1c', 'I1c'),
+        '1B': ('F6', 'G6', 'H6', 'I6', 'F7', 'G7', 'H7', 'I7', 'F7a', 'I7a', 'F7b', 'I7b'),
+        '2U': ('F1', 'G1', 'H1', 'I1', 'F1a', 'I1a', 'F1b', 'I1b', 'F1c', 'I1c'),
+        '2B': ('F7', 'G7', 'H7', 'I7', 'F7a', 'I7a', 'F7b', 'I7b'),
+        '3UR': ('I3', 'I4a', 'I4b'),
+        '3BR': ('I5', 'I4a', 'I4b'),
+        '3UL': ('F3', 'F4a', 'F4b'),
+        '3BL': ('F5', 'F4a', 'F4b'),
+        '4UR': ('I2', 'I1b', 'I7'),
+        '4BR': ('I6', 'I7a', 'I1', 'I7'),
+        '4UL': ('F2', 'F1b', 'F7'),
+        '4BL': ('F6', 'F7a', 'F1', 'F7'),
+        '6R': ('I4a', 'I4b', 'HI4'),
+        '6L': ('F4a', 'F4b', 'FG4'),
+        '5R': ('I7', 'I1', 'I1a', 'I7a', 'I7b', 'I1b', 'I1c'),
+        '5L': ('F7', 'F1', 'F1a', 'F7a', 'F7b', 'F1b', 'F1c')
+    }
+}
+
+# Fold order, (cluster name, rotate attribute, angle, direction of the x offset fix)
+# None = no offset fix
+fold_order = [
+    ('1B', 'rotateX', -90, None),
+    ('2B', 'rotateX', -90, None),
+    ('1U', 'rotateX', 90, None),
+    ('2U', 'rotateX', 89.8, None),
+    ('3UL', 'rotateX', 178, 1),
+    ('3BL', 'rotateX', 178, -1),
+    ('3UR', 'rotateX', 178, -1),
+    ('3BR', 'rotateX', 178, 1),
+    ('4UL', 'rotateX', 178, None),
+    ('4BL', 'rotateX', 178, None),
+    ('4UR', 'rotateX', 178, None),
+    ('4BR', 'rotateX', 178, None),
+    ('5L', 'rotateZ', 86, None),
+    ('5R', 'rotateZ', -86, None),
+    ('6L', 'rotateZ', -84, None),
+    ('6R', 'rotateZ', 84, None)
+]
+# Offset fixes left in place when unfolding, the rest are reset
+fold_fix_kept = ('3UR', '3BR')
+
+# Ribbon curves in creation order, (name, ribbon points in curve order)
+ribbon_curves = [
+    ('1U', ('U', 'UBmid', 'UBend', 'UB', 'BU', 'BUend', 'BUmid',
+            'B', 'BDmid', 'BDend', 'BD', 'DB', 'DBend', 'DBmid', 'D')),
+    ('1D', ('U', 'UFmid', 'UFend', 'UF', 'FU', 'FUend', 'FUmid',
+            'F', 'FDmid', 'FDend', 'FD', 'DF', 'DFend', 'DFmid', 'D')),
+    ('2L', ('D', 'DLmid', 'DLend', 'DL', 'LD', 'LDend', 'LDmid',
+            'L', 'LUmid', 'LUend', 'LU', 'UL', 'ULend', 'ULmid', 'U')),
+    ('2R', ('D', 'DRmid', 'DRend', 'DR', 'RD', 'RDend', 'RDmid',
+            'R', 'RUmid', 'RUend', 'RU', 'UR', 'URend', 'URmid', 'U')),
+    ('3L', ('bow_L1', 'bow_L2', 'bow_L3', 'bow_L4', 'bow_L5', 'bow_L6', 'bow_L7')),
+    ('3R', ('bow_R1', 'bow_R2', 'bow_R3', 'bow_R4', 'bow_R5', 'bow_R6')),
+    ('4', ('knot_1', 'knot_2', 'knot_3', 'knot_4', 'knot_5'))
+]
+
+# Ribbon width relative to the smallest side of the gift, by ribbon size
+ribbon_size_scale = {'L': 4.0, 'M': 2.5, 'S': 1.0}
+
+# Profile scale when changing ribbon size, (old size, new size) : multiplier
+ribbon_size_change = {
+    ('S', 'L'): 3.5,
+    ('S', 'M'): 2.5,
+    ('M', 'S'): 0.4,
+    ('M', 'L'): 1.4,
+    ('L', 'S'): 0.25,
+    ('L', 'M'): 0.625
+}
+
+# Ribbons tied in each segment of tieRibbon, in order
+ribbon_tie_order = [('1U', '1D'), ('2L', '2R'), ('3L', '3R'), ('4',)]
+
+# Rotation that lays the largest sides of the gift along the y-axis
+gift_side_rot = {'dw': None, 'dh': [0, 0, 90], 'wh': [90, 0, 0]}
+# (largest, smallest) sides that need a 90 degree turn around y
+gift_turn_sides = frozenset([('dw', 'wh'), ('dh', 'wh'), ('wh', 'dw')])
+
+# Values stored in the CTRL handle, (attribute, type)
+ctrl_attrs = [
+    ('wrap_name', 'string'),
+    ('wrap_id', 'string'),
+    ('wrap_thickness', 'float'),
+    ('wrap_color', 'string'),
+    ('ribbon_size', 'string'),
+    ('ribbon_color', 'string'),
+    ('animation_start', 'double'),
+    ('animation_end', 'double')
+]
+# addAttr type flag for each type in ctrl_attrs
+ctrl_attr_flags = {'string': ' -dt "string"', 'float': ' -at "float"', 'double': ''}
+
+# Node names of a wrap, shared by createGiftWrap and loadGiftWrap, see getNodeName
+node_names = {
+    'main': '%(name)s_gift_wrap_%(id)s_GRP',
+    'ribbon': 'ribbon_%(id)s_GRP',
+    'gift': 'gift_%(id)s_GRP',
+    'fold': 'fold_%(id)s_GRP',
+    'obj': 'obj_%(id)s_GRP',
+    'cluster': 'cluster_%(id)s_GRP',
+    'ribbon_crv': 'ribbon_crv_%(id)s_GRP',
+    'ctrl': 'CTRL_gift_%(id)s',
+    'plane': 'folding_plane_%(id)s',
+    'paper': 'wrap_paper_%(id)s'
+}
+
 wrap_list = []
+wrap_gifts = [] # wrap_list loaded, reused by the edit functions
+wrap_ctrl_pattern = re.compile(r'^.*_gift_wrap_[0-9A-Z]{5}_GRP\|CTRL_gift_[0-9A-Z]{5}$') # Long name of a CTRL handle
+
+# Color option menus in the UI, same order in the wrap and modify sections
+paper_color_labels = ('Random', 'Red', 'Green', 'Blue', 'Yellow', 'Black', 'White')
+ribbon_color_labels = ('Random', 'Red', 'Green', 'Blue', 'Yellow')
+
+# Width of each scroll list column, 0 = full width rows
+col_len = (0, 18, 8, 10, 10, 10, 10, 10)
+# A whole scroll list row, every column cut and padded like addPadding does
+row_format = ''.join(['%%-%d.%ds' % (n + 1, n) for n in col_len[1:]])
+
+scene_suspended = 0 # Depth of nested suspendScene calls
 
 
 class GiftWrap(object):
@@ -137,111 +449,119 @@ class GiftWrap(object):
             self.loadGiftWrap()
 
     def createGiftWrap(self, obj=None):
-        self.ribbon_thickness = self.wrap_thickness
-
-        # Group hierarchy
-        pm.select(None) # Deselect
-        self.main_group = pm.group(n="%s_gift_wrap_%s_GRP" % (self.wrap_name, self.wrap_id))
-        pm.select(None)
-        self.ribbon_group = pm.group(n="ribbon_%s_GRP" % (self.wrap_id,))
-        pm.select(None)
-        self.gift_group = pm.group(n="gift_%s_GRP" % (self.wrap_id),)
-        pm.select(None)
-        self.fold_group = pm.group(n="fold_%s_GRP" % (self.wrap_id),)
-        pm.select(None)
-        self.obj_group = pm.group(n="obj_%s_GRP" % (self.wrap_id),)
-        pm.select(None)
-        self.cluster_group = pm.group(n="cluster_%s_GRP" % (self.wrap_id),)
-        pm.inheritTransform(self.cluster_group, off=True) # Clusters need to stay where they are
-        pm.select(None)
-        self.r_curve_group = pm.group(n="ribbon_crv_%s_GRP" % (self.wrap_id),)
-        pm.inheritTransform(self.r_curve_group, off=True) # Ribbon curves need to stay where they are
-
-        if not obj:
-            # Get object to be gift wrapped
-            self.wrap_gift = pm.PyNode(self.wrap_name)
-
-            # Move gift into position
-            self.moveGift()
-
-        side_a, side_d, side_e = self.getObjectSides() # bounding box
-        self.fold_fix = side_d / 113 # value used to slightly offset the x value of some of the fold clusters that act up
-
-        # parent all groups to ctrl handle
-        self.ctrl_handle = self.createControlHandle(side_a*1.4)
-        self.storeCtrlValues() # Store values in the CTRL handle for future reference
-        pm.parent(self.ctrl_handle[0], self.main_group)
-        pm.parent([self.fold_group, self.obj_group], self.gift_group)
-        pm.parent([self.gift_group, self.cluster_group, self.ribbon_group, self.r_curve_group], self.ctrl_handle[0])
-        pm.parent(self.wrap_gift, self.obj_group)
-
-        self.cluster_group.visibility.set(0)
-        self.r_curve_group.visibility.set(0)
-
-        # get folding pattern, create folding plane
-        self.folding_pattern = self.getFoldingPattern(side_a, side_d, side_e, self.wrap_thickness)
-        self.f_plane, self.folding_pattern = self.createFoldingPlane(self.folding_pattern)
-        self.f_plane[0].visibility.set(0)
-        pm.parent(self.f_plane, self.fold_group)
-
-        # create paper mesh and folding clusters
-        self.wrap_paper = self.createPaper(self.f_plane, self.wrap_thickness)
-        self.wrap_paper[0].visibility.set(1)
-        self.folding_pivots =  self.getFoldingPivots(self.folding_pattern)
-        self.createClusters(self.folding_pattern, self.folding_pivots)
-
-        # get bounding box of final wrap (no  ribbon)
-        self.foldPaper(16)
-        self.side_width, self.side_height, self.side_depth = self.getWrapSides()
-        self.foldPaper(0)
-
-        # create ribbon
-        self.ribbon_width = self.getRibbonWidth(self.ribbon_size, side_d, side_e)
-        self.ribbon_points = self.getRibbonPoints(self.side_width, self.side_height, self.side_depth, side_a, self.wrap_thickness, self.ribbon_thickness, self.ribbon_width)
-        self.ribbons, self.r_profile = self.createRibbon(self.ribbon_points, self.ribbon_thickness, self.ribbon_width)
-
-        self.setDrivenKeys() # Animate
-
-        self.applyColor()
-
-        self.moveBack()
-
-        self.setAnimation()
+        with suspendScene():
+            self.ribbon_thickness = self.wrap_thickness
+
+            # Group hierarchy
+            self.main_group = self.createGroup(self.getNodeName('main'))
+            self.ribbon_group = self.createGroup(self.getNodeName('ribbon'))
+            self.gift_group = self.createGroup(self.getNodeName('gift'))
+            self.fold_group = self.createGroup(self.getNodeName('fold'), self.gift_group)
+            self.obj_group = self.createGroup(self.getNodeName('obj'), self.gift_group)
+            self.cluster_group = self.createGroup(self.getNodeName('cluster'))
+            mc.setAttr('%s.inheritsTransform' % (self.cluster_group,), 0) # Clusters need to stay where they are
+            self.r_curve_group = self.createGroup(self.getNodeName('ribbon_crv'))
+            mc.setAttr('%s.inheritsTransform' % (self.r_curve_group,), 0) # Ribbon curves need to stay where they are
+
+            if not obj:
+                # Get object to be gift wrapped
+                self.wrap_gift = pm.PyNode(self.wrap_name)
+
+                # Move gift into position
+                self.moveGift()
+
+            side_a, side_d, side_e = self.getObjectSides() # bounding box
+            self.fold_fix = side_d / 113 # value used to slightly offset the x value of some of the fold clusters that act up
+
+            # parent all groups to ctrl handle
+            self.ctrl_handle = self.createControlHandle(side_a*1.4)
+            self.storeCtrlValues() # Store values in the CTRL handle for future reference
+            pm.parent(self.ctrl_handle[0], self.main_group)
+            pm.parent([self.gift_group, self.cluster_group, self.ribbon_group, self.r_curve_group], self.ctrl_handle[0])
+            pm.parent(self.wrap_gift, self.obj_group)
+
+            self.cluster_group.visibility.set(0)
+            self.r_curve_group.visibility.set(0)
+
+            # get folding pattern, create folding plane
+            self.folding_pattern = self.getFoldingPattern(side_a, side_d, side_e, self.wrap_thickness)
+            self.f_plane, self.folding_ids = self.createFoldingPlane(self.folding_pattern)
+            self.f_plane[0].visibility.set(0)
+            pm.parent(self.f_plane, self.fold_group)
+
+            # create paper mesh and folding clusters
+            self.wrap_paper = self.createPaper(self.f_plane, self.wrap_thickness)
+            self.wrap_paper[0].visibility.set(1)
+            self.folding_pivots =  self.getFoldingPivots(self.folding_pattern)
+            self.createClusters(self.folding_ids, self.folding_pivots)
+
+            # get bounding box of final wrap (no  ribbon), measured since the
+            # 5L/5R and 6L/6R flaps stop short of 90 degrees, see fold_order
+            self.foldPaper(16)
+            self.side_width, self.side_height, self.side_depth = self.getWrapSides()
+            self.foldPaper(0)
+
+            # create ribbon
+            self.ribbon_width = self.getRibbonWidth(self.ribbon_size, side_d, side_e)
+            self.ribbon_points = self.getRibbonPoints(self.side_width, self.side_height, self.side_depth, side_a, self.wrap_thickness, self.ribbon_thickness, self.ribbon_width)
+            self.ribbons, self.r_profile = self.createRibbon(self.ribbon_points, self.ribbon_thickness, self.ribbon_width)
+
+            self.setDrivenKeys() # Animate
+
+            self.applyColor()
+
+            self.moveBack()
+
+            self.setAnimation()
+
+            self.ctrl_handle[0].animation.set(15)
+
+    def createGroup(self, name, parent=None):
+        """
+        Creates an empty group, skips the selection based pm.group
+        """
+        if parent is None:
+            grp = mc.createNode('transform', n=name, skipSelect=True)
+        else:
+            grp = mc.createNode('transform', n=name, p=str(parent), skipSelect=True)
+        return pm.PyNode(grp)
 
-        self.ctrl_handle[0].animation.set(15)
+    def getNodeName(self, key):
+        """
+        Name of one of the nodes of this wrap, see node_names
+        """
+        return node_names[key] % {'name': self.wrap_name, 'id': self.wrap_id}
 
     def removeGiftWrap(self):
         """
         Unparents object to be wrapped, resets rotate/translate,
         deletes everything else.
         """
-        pm.parent(self.wrap_gift, w=True) # Unparent object
-        pm.move(0, self.wrap_thickness, 0, self.wrap_gift, rpr=True)
-        self.wrap_gift.rotate.set(0,0,0)
-        pm.delete(self.main_group) # Remove everything else
+        with suspendScene():
+            pm.parent(self.wrap_gift, w=True) # Unparent object
+            pm.move(0, self.wrap_thickness, 0, self.wrap_gift, rpr=True)
+            self.wrap_gift.rotate.set(0,0,0)
+            pm.delete(self.main_group) # Remove everything else
 
     def loadGiftWrap(self):
         self.ctrl_handle = [pm.PyNode(self.wrap_name)]
         self.retrieveCtrlValues()
 
-        main_grp_name = "%s_gift_wrap_%s_GRP" % (self.wrap_name, self.wrap_id)
-        gift_grp_name = "gift_%s_GRP" % (self.wrap_id,)
-        obj_grp_name = "obj_%s_GRP" % (self.wrap_id,)
-        obj_name = str(self.ctrl_handle[0]) + "|"
-        obj_name += gift_grp_name + "|" + obj_grp_name + "|"
-        obj_name += self.wrap_name
-        fold_grp_name = "fold_%s_GRP" % (self.wrap_id,)
-        paper_name = main_grp_name + "|" + str(self.ctrl_handle[0]) + "|"
-        paper_name += gift_grp_name + "|" + fold_grp_name + "|"
-        paper_name += "wrap_paper_%s" % (self.wrap_id,)
+        main_grp_name = self.getNodeName('main')
+        gift_grp_name = self.getNodeName('gift')
+        obj_name = "%s|%s|%s|%s" % (self.ctrl_handle[0], gift_grp_name, self.getNodeName('obj'), self.wrap_name)
+        paper_name = "%s|%s|%s|%s|%s" % (main_grp_name, self.ctrl_handle[0], gift_grp_name, self.getNodeName('fold'), self.getNodeName('paper'))
 
         self.wrap_gift = pm.PyNode(obj_name)
         self.main_group = pm.PyNode(main_grp_name)
         self.wrap_paper = [pm.PyNode(paper_name)]
+        self.gift_bbox_size = mc.getAttr('%s.boundingBoxSize' % (self.wrap_gift.longName(),))[0] # As getObjectSides
 
-        self.ribbons = pm.listRelatives(self.ctrl_handle, ad=True, ap=False, typ="nurbsSurface")
+        # Ribbon surfaces and profile curve, a single pass over the hierarchy
+        ribbon_shapes = pm.listRelatives(self.ctrl_handle, ad=True, ap=False, typ=["nurbsSurface", "nurbsCurve"])
+        self.ribbons = [shape for shape in ribbon_shapes if isinstance(shape, pm.nt.NurbsSurface)]
 
-        ribbon_prof = pm.listRelatives(self.ctrl_handle, ad=True, ap=False, typ="nurbsCurve")
+        ribbon_prof = [shape for shape in ribbon_shapes if isinstance(shape, pm.nt.NurbsCurve)]
         ribbon_prof = ribbon_prof[-1]
         self.ribbon_prof = pm.listRelatives(ribbon_prof, ap=True)
 
@@ -249,24 +569,17 @@ class GiftWrap(object):
         self.ini_t = self.main_group.translate.get()
 
     def storeCtrlValues(self):
-        self.ctrl_handle[0].wrap_name.set(self.wrap_name)
-        self.ctrl_handle[0].wrap_id.set(self.wrap_id)
-        self.ctrl_handle[0].wrap_thickness.set(self.wrap_thickness)
-        self.ctrl_handle[0].wrap_color.set(self.wrap_color)
-        self.ctrl_handle[0].ribbon_size.set(self.ribbon_size)
-        self.ctrl_handle[0].ribbon_color.set(self.ribbon_color)
-        self.ctrl_handle[0].animation_start.set(self.animation_start)
-        self.ctrl_handle[0].animation_end.set(self.animation_end)
+        ctrl = str(self.ctrl_handle[0])
+        for attr, attr_type in ctrl_attrs:
+            if attr_type == 'string':
+                mc.setAttr("%s.%s" % (ctrl, attr), str(getattr(self, attr)), type='string')
+            else:
+                mc.setAttr("%s.%s" % (ctrl, attr), getattr(self, attr))
 
     def retrieveCtrlValues(self):
-        self.wrap_name = self.ctrl_handle[0].wrap_name.get()
-        self.wrap_id = self.ctrl_handle[0].wrap_id.get()
-        self.wrap_thickness = self.ctrl_handle[0].wrap_thickness.get()
-        self.wrap_color = self.ctrl_handle[0].wrap_color.get()
-        self.ribbon_size = self.ctrl_handle[0].ribbon_size.get()
-        self.ribbon_color = self.ctrl_handle[0].ribbon_color.get()
-        self.animation_start = self.ctrl_handle[0].animation_start.get()
-        self.animation_end = self.ctrl_handle[0].animation_end.get()
+        ctrl = str(self.ctrl_handle[0])
+        for attr, attr_type in ctrl_attrs:
+            setattr(self, attr, mc.getAttr("%s.%s" % (ctrl, attr)))
 
     def moveGift(self):
         """
@@ -278,9 +591,6 @@ class GiftWrap(object):
         # Store initial transform values
         self.ini_r = self.wrap_gift.getRotation(space='object')
         self.ini_t = self.wrap_gift.getTranslation(space='object')
-        # Store initial pivot values
-        self.ini_sp = self.wrap_gift.getScalePivot()
-        self.ini_rp = self.wrap_gift.getRotatePivot()
         # Center pivot
         self.wrap_gift.centerPivots()
         # Reset rotation
@@ -289,59 +599,33 @@ class GiftWrap(object):
         pm.move(0, 0, 0, self.wrap_gift, rpr=True)
 
         # Get bounding box dimensions
-        bbox_minmax = self.wrap_gift.boundingBoxMax.get() - self.wrap_gift.boundingBoxMin.get()
-        self.bbox_height = bbox_minmax[1]
-        self.bbox_depth = bbox_minmax[2]
-        self.bbox_width = bbox_minmax[0]
+        self.bbox_width, self.bbox_height, self.bbox_depth = mc.getAttr('%s.boundingBoxSize' % (self.wrap_gift,))[0]
 
-        # Sort sides by area
+        # Area of each pair of sides
         side_area = [
             ('dw', self.bbox_depth * self.bbox_width),
             ('dh', self.bbox_depth * self.bbox_height),
             ('wh', self.bbox_width * self.bbox_height)
         ]
-
-        side_area.sort(key = lambda sArea: sArea[1])
+        # Ties resolve as a stable sort would: first smallest, last largest
+        smallest_a = min(side_area, key=lambda s_area: s_area[1])[0]
+        largest_a = max(reversed(side_area), key=lambda s_area: s_area[1])[0]
 
         # Positions object, largest side facing down(Y), pivot centered to bottom
-        gift_new_pivot = []
-        gift_add_rot = []
-
-        if side_area[2][0] == 'dw':
-            gift_new_pivot = [0, self.bbox_height / -2, 0]
-            self.wrap_gift.setScalePivot(gift_new_pivot)
-            self.wrap_gift.setRotatePivot(gift_new_pivot)
-            pm.move(0, self.wrap_thickness, 0, self.wrap_gift, rpr=True)
-
-        elif side_area[2][0] == 'dh':
-            gift_new_pivot = [self.bbox_width / -2, 0, 0]
-            self.wrap_gift.setScalePivot(gift_new_pivot)
-            self.wrap_gift.setRotatePivot(gift_new_pivot)
-            pm.move(0, self.wrap_thickness, 0, self.wrap_gift, rpr=True)
-            self.wrap_gift.setRotation([0, 0, 90], space='object')
-
-        elif side_area[2][0] == 'wh':
-            gift_new_pivot = [0, 0, self.bbox_depth/2]
-            self.wrap_gift.setScalePivot(gift_new_pivot)
-            self.wrap_gift.setRotatePivot(gift_new_pivot)
-            pm.move(0, self.wrap_thickness, 0, self.wrap_gift, rpr=True)
-            self.wrap_gift.setRotation([90, 0, 0], space='object')
+        gift_new_pivot = {
+            'dw': [0, self.bbox_height / -2, 0],
+            'dh': [self.bbox_width / -2, 0, 0],
+            'wh': [0, 0, self.bbox_depth / 2]
+        }[largest_a]
+        mc.xform(self.wrap_gift.longName(), objectSpace=True, pivots=gift_new_pivot)
+        pm.move(0, self.wrap_thickness, 0, self.wrap_gift, rpr=True)
+        if gift_side_rot[largest_a]:
+            self.wrap_gift.setRotation(gift_side_rot[largest_a], space='object')
 
         pm.makeIdentity(self.wrap_gift, a=True)
 
         # Rotates object, smallest side pointing left/right(X)
-
-        if  side_area[2][0] == 'dw' and side_area[0][0] == 'wh':
-            gift_add_rot = self.wrap_gift.getRotation(space='object')
-            gift_add_rot[1] += 90
-            self.wrap_gift.setRotation(gift_add_rot, space='object')
-
-        elif  side_area[2][0] == 'dh' and side_area[0][0] == 'wh':
-            gift_add_rot = self.wrap_gift.getRotation(space='object')
-            gift_add_rot[1] += 90
-            self.wrap_gift.setRotation(gift_add_rot, space='object')
-
-        elif  side_area[2][0] == 'wh' and side_area[0][0] == 'dw':
+        if (largest_a, smallest_a) in gift_turn_sides:
             gift_add_rot = self.wrap_gift.getRotation(space='object')
             gift_add_rot[1] += 90
             self.wrap_gift.setRotation(gift_add_rot, space='object')
@@ -354,26 +638,20 @@ class GiftWrap(object):
         self.main_group.rotate.set(self.ini_r)
 
     def createControlHandle(self, radius):
-        ctrl = pm.circle(r=radius, n="CTRL_gift_" + self.wrap_id)
-        pm.addAttr(longName="animation", k=True)
-        pm.addAttr(longName="wrap_name", dt='string', hidden=True, k=False)
-        pm.addAttr(longName="wrap_id", dt='string', hidden=True, k=False)
-        pm.addAttr(longName="wrap_thickness", at='float', hidden=True, k=False)
-        pm.addAttr(longName="wrap_color", dt='string', hidden=True, k=False)
-        pm.addAttr(longName="ribbon_size", dt='string', hidden=True, k=False)
-        pm.addAttr(longName="ribbon_color", dt='string', hidden=True, k=False)
-        pm.addAttr(longName="animation_start", hidden=True, k=False)
-        pm.addAttr(longName="animation_end", hidden=True, k=False)
+        ctrl = pm.circle(r=radius, n=self.getNodeName('ctrl'))
+        # Add all attributes in one go, the stored values follow ctrl_attrs
+        evalthis = 'addAttr -ln "animation" -k 1 %(ctrl)s;'
+        for attr, attr_type in ctrl_attrs:
+            evalthis += 'addAttr -ln "%s"%s -h 1 -k 0 %%(ctrl)s;' % (attr, ctrl_attr_flags[attr_type])
+        mel.eval(evalthis % {'ctrl': ctrl[0]})
         ctrl[0].rotate.set(90,0,0)
         pm.makeIdentity(ctrl, a=True)
         return ctrl
 
     def setColor(self, color, type=1):
-        c_list = ['green', 'red', 'blue', 'yellow']
-        if type == 1 : c_list += ['white', 'black']
-        if not color in c_list:
-            random.shuffle(c_list)
-            color = c_list[0]
+        # shader_names is keyed by color, a hashed membership test
+        if color not in shader_names[type]:
+            color = random.choice(color_list[type])
 
         return color
 
@@ -381,155 +659,11 @@ class GiftWrap(object):
         """
         Finds the coordinates for the wrapping folds
         """
-        # y-axis
-        y_gft = gft_thick / 2
-
-        # calculate sides
-        gft_side_a += gft_thick
-        gft_side_d += gft_thick
-        gft_side_b = gft_side_d * 0.6
-        gft_side_c = gft_side_e / 2 + y_gft
-        gft_side_e += gft_thick # needs to be run last
-
-        # check if folds will overlap
-        if gft_side_e < (2 * gft_side_b):
-            self.wrap_overlap = True;
-        else:
-            self.wrap_overlap = False;
-
-        # calculate side f
-        if not self.wrap_overlap:
-            gft_side_f = gft_side_c - gft_side_b
-        else:
-            gft_side_f = gft_side_b - gft_side_c
-
-        # x-axis
-        x_h = (gft_side_a / 2)
-        x_i = x_h + gft_side_b
-        x_g = x_h * -1
-        x_f = x_i * -1
-
-        # y-axis
-        z_5 = (gft_side_e / 2)
-        z_6 = z_5 + gft_side_d
-        z_7 = z_6 + gft_side_c
-        z_3 = z_5 * -1
-        z_2 = z_6 * -1
-
-        # calculate z-1 axis
-        if not self.wrap_overlap:
-            z_1 = z_7 * -1
-        else:
-            z_1 = z_2 - gft_side_b
-
-        # calculate z-8 axis
-        if not self.wrap_overlap:
-            z_8 = z_7 + gft_side_f
-        else:
-            z_8 = z_7
-
-        # Coordinates in world space, vertex ID is added later
-        # x = F
-        gift_fold_points = {'F1' : [dt.Vector(x_f, y_gft, z_1),0]}
-        gift_fold_points['F2'] = [dt.Vector(x_f, y_gft, z_2),0]
-        gift_fold_points['F3'] = [dt.Vector(x_f, y_gft, z_3),0]
-        gift_fold_points['F4'] = [dt.Vector(x_f, y_gft, 0.0),0]
-        gift_fold_points['F5'] = [dt.Vector(x_f, y_gft, z_5),0]
-        gift_fold_points['F6'] = [dt.Vector(x_f, y_gft, z_6),0]
-        gift_fold_points['F7'] = [dt.Vector(x_f, y_gft, z_7),0]
-        gift_fold_points['F8'] = [dt.Vector(x_f, y_gft, z_8),0]
-        # x = G
-        gift_fold_points['G1'] = [dt.Vector(x_g, y_gft, z_1),0]
-        gift_fold_points['G2'] = [dt.Vector(x_g, y_gft, z_2),0]
-        gift_fold_points['G3'] = [dt.Vector(x_g, y_gft, z_3),0]
-        gift_fold_points['G4'] = [dt.Vector(x_g, y_gft, 0.0),0]
-        gift_fold_points['G5'] = [dt.Vector(x_g, y_gft, z_5),0]
-        gift_fold_points['G6'] = [dt.Vector(x_g, y_gft, z_6),0]
-        gift_fold_points['G7'] = [dt.Vector(x_g, y_gft, z_7),0]
-        gift_fold_points['G8'] = [dt.Vector(x_g, y_gft, z_8),0]
-        # x = H
-        gift_fold_points['H1'] = [dt.Vector(x_h, y_gft, z_1),0]
-        gift_fold_points['H2'] = [dt.Vector(x_h, y_gft, z_2),0]
-        gift_fold_points['H3'] = [dt.Vector(x_h, y_gft, z_3),0]
-        gift_fold_points['H4'] = [dt.Vector(x_h, y_gft, 0.0),0]
-        gift_fold_points['H5'] = [dt.Vector(x_h, y_gft, z_5),0]
-        gift_fold_points['H6'] = [dt.Vector(x_h, y_gft, z_6),0]
-        gift_fold_points['H7'] = [dt.Vector(x_h, y_gft, z_7),0]
-        gift_fold_points['H8'] = [dt.Vector(x_h, y_gft, z_8),0]
-        # x = I
-        gift_fold_points['I1'] = [dt.Vector(x_i, y_gft, z_1),0]
-        gift_fold_points['I2'] = [dt.Vector(x_i, y_gft, z_2),0]
-        gift_fold_points['I3'] = [dt.Vector(x_i, y_gft, z_3),0]
-        gift_fold_points['I4'] = [dt.Vector(x_i, y_gft, 0.0),0]
-        gift_fold_points['I5'] = [dt.Vector(x_i, y_gft, z_5),0]
-        gift_fold_points['I6'] = [dt.Vector(x_i, y_gft, z_6),0]
-        gift_fold_points['I7'] = [dt.Vector(x_i, y_gft, z_7),0]
-        gift_fold_points['I8'] = [dt.Vector(x_i, y_gft, z_8),0]
-
-        # calculate diagonal folds F4a, F4b, I4a, I4b
-        gift_fold_points['I4a'] = [dt.Vector(x_i, y_gft, z_3),0]
-        gift_fold_points['I4a'][0].z += gft_side_b
-        gift_fold_points['I4b'] = [dt.Vector(x_i, y_gft, z_5),0]
-        gift_fold_points['I4b'][0].z -= gft_side_b
-
-        gift_fold_points['F4a'] = [dt.Vector(x_f, y_gft, z_3),0]
-        gift_fold_points['F4a'][0].z += gft_side_b
-        gift_fold_points['F4b'] = [dt.Vector(x_f, y_gft, z_5),0]
-        gift_fold_points['F4b'][0].z -= gft_side_b
-
-        # calculate intersecting points HI4, FG4
-        if self.wrap_overlap:
-            gift_fold_points['HI4'] = [dt.Vector(x_h, y_gft, 0.0),0]
-            gift_fold_points['HI4'][0].x += gft_side_e / 2
-            gift_fold_points['FG4'] = [dt.Vector(x_g, y_gft, 0.0),0]
-            gift_fold_points['FG4'][0].x -= gft_side_e / 2
-
-        # calculate diagonal folds F1a, I1a
-        if not self.wrap_overlap:
-            gift_fold_points['I1a'] = [dt.Vector(x_i, y_gft, z_2),0]
-            gift_fold_points['I1a'][0].z -= gft_side_b
-            gift_fold_points['F1a'] = [dt.Vector(x_f, y_gft, z_2),0]
-            gift_fold_points['F1a'][0].z -= gft_side_b
-        else:
-            gift_fold_points['I1a'] = [dt.Vector(x_i, y_gft, z_1),0]
-            gift_fold_points['I1a'][0].z += gft_side_b - gft_side_c
-            gift_fold_points['I1a'][0].x -= gft_side_b - gft_side_c
-            gift_fold_points['F1a'] = [dt.Vector(x_f, y_gft, z_1),0]
-            gift_fold_points['F1a'][0].z += gft_side_b - gft_side_c
-            gift_fold_points['F1a'][0].x += gft_side_b - gft_side_c
-
-        # calculate diagonal folds F1b, I1b
-        if self.wrap_overlap:
-            gift_fold_points['I1b'] = [dt.Vector(x_i, y_gft, z_1),0]
-            gift_fold_points['I1b'][0].z += (gft_side_b - gft_side_c) * 2
-            gift_fold_points['F1b'] = [dt.Vector(x_f, y_gft, z_1),0]
-            gift_fold_points['F1b'][0].z += (gft_side_b - gft_side_c) * 2
-
-        # calculate diagonal folds F1c, I1c
-        if self.wrap_overlap:
-            gift_fold_points['I1c'] = [dt.Vector(x_i, y_gft, z_1),0]
-            gift_fold_points['I1c'][0].x -= (gft_side_b - gft_side_c) * 2
-            gift_fold_points['F1c'] = [dt.Vector(x_f, y_gft, z_1),0]
-            gift_fold_points['F1c'][0].x += (gft_side_b - gft_side_c) * 2
+        self.wrap_overlap, fold_coords = getFoldingCoordinates(gft_side_a, gft_side_d, gft_side_e, gft_thick)
 
-        # calculate diagonal folds F7a, I7a
-        if not self.wrap_overlap:
-            gift_fold_points['I7a'] = [dt.Vector(x_i, y_gft, z_6),0]
-            gift_fold_points['I7a'][0].z += gft_side_b
-            gift_fold_points['F7a'] = [dt.Vector(x_f, y_gft, z_6),0]
-            gift_fold_points['F7a'][0].z += gft_side_b
-        else:
-            gift_fold_points['I7a'] = [dt.Vector(x_i, y_gft, z_7),0]
-            gift_fold_points['I7a'][0].z -= gft_side_b - gft_side_c
-            gift_fold_points['F7a'] = [dt.Vector(x_f, y_gft, z_7),0]
-            gift_fold_points['F7a'][0].z -= gft_side_b - gft_side_c
-
-        # calculate diagonal folds F7b, I7b
-        if self.wrap_overlap:
-            gift_fold_points['I7b'] = [dt.Vector(x_i, y_gft, z_7),0]
-            gift_fold_points['I7b'][0].x -= gft_side_b - gft_side_c
-            gift_fold_points['F7b'] = [dt.Vector(x_f, y_gft, z_7),0]
-            gift_fold_points['F7b'][0].x += gft_side_b - gft_side_c
+        gift_fold_points = {}
+        for key, coords in fold_coords.items():
+            gift_fold_points[key] = dt.Vector(coords)
 
         return gift_fold_points
 
@@ -537,271 +671,193 @@ class GiftWrap(object):
         """
         Create polyplane that will fold up and serve as a wrap deformer
         """
-        plane_name = "folding_plane_%s" % (self.wrap_id,)
+        plane_name = self.getNodeName('plane')
 
         # Creates a basic polyplane
         wrap_fold_pln = pm.polyPlane(n=plane_name, sx=3, sy=6, ch=0)
+        plane = wrap_fold_pln[0]
+        vtx_range = "%s.vtx[%%d:%%d]" % (plane.longName(),) # Inclusive, expanded by Maya
+
+        # Local names for the calls repeated in every stage below
+        setVertexPositions = self.setVertexPositions
+        subdivideFacet = pm.polySubdivideFacet
+        mergeVertex = mc.polyMergeVertex
+        delEdge = pm.polyDelEdge
 
         # Moves vertices to align them with folding pattern,
-        wrap_fold_pln[0].vtx[0].setPosition(wrap_points['F8'][0])
-        wrap_fold_pln[0].vtx[1].setPosition(wrap_points['G8'][0])
-        wrap_fold_pln[0].vtx[2].setPosition(wrap_points['H8'][0])
-        wrap_fold_pln[0].vtx[3].setPosition(wrap_points['I8'][0])
-        wrap_fold_pln[0].vtx[4].setPosition(wrap_points['F7'][0])
-        wrap_fold_pln[0].vtx[5].setPosition(wrap_points['G7'][0])
-        wrap_fold_pln[0].vtx[6].setPosition(wrap_points['H7'][0])
-        wrap_fold_pln[0].vtx[7].setPosition(wrap_points['I7'][0])
-        wrap_fold_pln[0].vtx[8].setPosition(wrap_points['F6'][0])
-        wrap_fold_pln[0].vtx[9].setPosition(wrap_points['G6'][0])
-        wrap_fold_pln[0].vtx[10].setPosition(wrap_points['H6'][0])
-        wrap_fold_pln[0].vtx[11].setPosition(wrap_points['I6'][0])
-        wrap_fold_pln[0].vtx[12].setPosition(wrap_points['F5'][0])
-        wrap_fold_pln[0].vtx[13].setPosition(wrap_points['G5'][0])
-        wrap_fold_pln[0].vtx[14].setPosition(wrap_points['H5'][0])
-        wrap_fold_pln[0].vtx[15].setPosition(wrap_points['I5'][0])
-        wrap_fold_pln[0].vtx[16].setPosition(wrap_points['F3'][0])
-        wrap_fold_pln[0].vtx[17].setPosition(wrap_points['G3'][0])
-        wrap_fold_pln[0].vtx[18].setPosition(wrap_points['H3'][0])
-        wrap_fold_pln[0].vtx[19].setPosition(wrap_points['I3'][0])
-        wrap_fold_pln[0].vtx[20].setPosition(wrap_points['F2'][0])
-        wrap_fold_pln[0].vtx[21].setPosition(wrap_points['G2'][0])
-        wrap_fold_pln[0].vtx[22].setPosition(wrap_points['H2'][0])
-        wrap_fold_pln[0].vtx[23].setPosition(wrap_points['I2'][0])
-        wrap_fold_pln[0].vtx[24].setPosition(wrap_points['F1'][0])
-        wrap_fold_pln[0].vtx[25].setPosition(wrap_points['G1'][0])
-        wrap_fold_pln[0].vtx[26].setPosition(wrap_points['H1'][0])
-        wrap_fold_pln[0].vtx[27].setPosition(wrap_points['I1'][0])
+        setVertexPositions(plane, dict([(vtx_id, wrap_points[key]) for vtx_id, key in enumerate(plane_vtx_order)]))
 
         # Models mid right diagonal folds
         if not self.wrap_overlap:
-            temp_face = wrap_fold_pln[0].f[11]
-            pm.polySubdivideFacet(temp_face, duv=1, dvv=3, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[31].setPosition(wrap_points['H3'][0])
-            wrap_fold_pln[0].vtx[30].setPosition(wrap_points['H5'][0])
-            wrap_fold_pln[0].vtx[29].setPosition(wrap_points['I4a'][0])
-            wrap_fold_pln[0].vtx[28].setPosition(wrap_points['I4b'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[14:31], ch=0)
+            temp_face = plane.f[11]
+            subdivideFacet(temp_face, duv=1, dvv=3, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                31: wrap_points['H3'],
+                30: wrap_points['H5'],
+                29: wrap_points['I4a'],
+                28: wrap_points['I4b']})
+            mergeVertex(vtx_range % (14, 31), ch=0)
         else:
-            temp_face = wrap_fold_pln[0].f[11]
-            pm.polySubdivideFacet(temp_face, duv=2, dvv=3, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[35].setPosition(wrap_points['HI4'][0])
-            wrap_fold_pln[0].vtx[34].setPosition(wrap_points['HI4'][0])
-            wrap_fold_pln[0].vtx[33].setPosition(wrap_points['H5'][0])
-            wrap_fold_pln[0].vtx[32].setPosition(wrap_points['H3'][0])
-            wrap_fold_pln[0].vtx[31].setPosition(wrap_points['H5'][0])
-            wrap_fold_pln[0].vtx[30].setPosition(wrap_points['I4b'][0])
-            wrap_fold_pln[0].vtx[29].setPosition(wrap_points['I4a'][0])
-            wrap_fold_pln[0].vtx[28].setPosition(wrap_points['H3'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[14:35], ch=0)
+            temp_face = plane.f[11]
+            subdivideFacet(temp_face, duv=2, dvv=3, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                35: wrap_points['HI4'],
+                34: wrap_points['HI4'],
+                33: wrap_points['H5'],
+                32: wrap_points['H3'],
+                31: wrap_points['H5'],
+                30: wrap_points['I4b'],
+                29: wrap_points['I4a'],
+                28: wrap_points['H3']})
+            mergeVertex(vtx_range % (14, 35), ch=0)
 
         # Models mid left diagonal folds
         if not self.wrap_overlap:
-            temp_face = wrap_fold_pln[0].f[9]
-            pm.polySubdivideFacet(temp_face, duv=1, dvv=3, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[31].setPosition(wrap_points['G3'][0])
-            wrap_fold_pln[0].vtx[30].setPosition(wrap_points['G5'][0])
-            wrap_fold_pln[0].vtx[33].setPosition(wrap_points['F4a'][0])
-            wrap_fold_pln[0].vtx[32].setPosition(wrap_points['F4b'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[12:33], ch=0)
+            temp_face = plane.f[9]
+            subdivideFacet(temp_face, duv=1, dvv=3, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                31: wrap_points['G3'],
+                30: wrap_points['G5'],
+                33: wrap_points['F4a'],
+                32: wrap_points['F4b']})
+            mergeVertex(vtx_range % (12, 33), ch=0)
         else:
-            temp_face = wrap_fold_pln[0].f[9]
-            pm.polySubdivideFacet(temp_face, duv=2, dvv=3, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[38].setPosition(wrap_points['FG4'][0])
-            wrap_fold_pln[0].vtx[37].setPosition(wrap_points['FG4'][0])
-            wrap_fold_pln[0].vtx[36].setPosition(wrap_points['G5'][0])
-            wrap_fold_pln[0].vtx[35].setPosition(wrap_points['F4b'][0])
-            wrap_fold_pln[0].vtx[34].setPosition(wrap_points['F4a'][0])
-            wrap_fold_pln[0].vtx[33].setPosition(wrap_points['G3'][0])
-            wrap_fold_pln[0].vtx[32].setPosition(wrap_points['G5'][0])
-            wrap_fold_pln[0].vtx[31].setPosition(wrap_points['G3'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[12:38], ch=0)
+            temp_face = plane.f[9]
+            subdivideFacet(temp_face, duv=2, dvv=3, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                38: wrap_points['FG4'],
+                37: wrap_points['FG4'],
+                36: wrap_points['G5'],
+                35: wrap_points['F4b'],
+                34: wrap_points['F4a'],
+                33: wrap_points['G3'],
+                32: wrap_points['G5'],
+                31: wrap_points['G3']})
+            mergeVertex(vtx_range % (12, 38), ch=0)
 
         # Models top right diagonal folds
         if not self.wrap_overlap:
-            temp_face = wrap_fold_pln[0].f[17]
-            pm.polySubdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[33].setPosition(wrap_points['H2'][0])
-            wrap_fold_pln[0].vtx[32].setPosition(wrap_points['I1a'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[22:33], ch=0)
+            temp_face = plane.f[17]
+            subdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                33: wrap_points['H2'],
+                32: wrap_points['I1a']})
+            mergeVertex(vtx_range % (22, 33), ch=0)
         else:
-            temp_face = wrap_fold_pln[0].f[16]
-            pm.polySubdivideFacet(temp_face, duv=2, dvv=2, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[38].setPosition(wrap_points['I1a'][0])
-            wrap_fold_pln[0].vtx[37].setPosition(wrap_points['H2'][0])
-            wrap_fold_pln[0].vtx[35].setPosition(wrap_points['I1b'][0])
-            wrap_fold_pln[0].vtx[34].setPosition(wrap_points['I1'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[22:38], ch=0)
-            pm.polyDelEdge(wrap_fold_pln[0].e[62], ch=0, cv=1)
+            temp_face = plane.f[16]
+            subdivideFacet(temp_face, duv=2, dvv=2, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                38: wrap_points['I1a'],
+                37: wrap_points['H2'],
+                35: wrap_points['I1b'],
+                34: wrap_points['I1']})
+            mergeVertex(vtx_range % (22, 38), ch=0)
+            delEdge(plane.e[62], ch=0, cv=1)
 
         # Models top left diagonal folds
         if not self.wrap_overlap:
-            temp_face = wrap_fold_pln[0].f[15]
-            pm.polySubdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[33].setPosition(wrap_points['G2'][0])
-            wrap_fold_pln[0].vtx[34].setPosition(wrap_points['F1a'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[21:33], ch=0)
+            temp_face = plane.f[15]
+            subdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                33: wrap_points['G2'],
+                34: wrap_points['F1a']})
+            mergeVertex(vtx_range % (21, 33), ch=0)
         else:
-            temp_face = wrap_fold_pln[0].f[14]
-            pm.polySubdivideFacet(temp_face, duv=2, dvv=2, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[40].setPosition(wrap_points['F1a'][0])
-            wrap_fold_pln[0].vtx[39].setPosition(wrap_points['G2'][0])
-            wrap_fold_pln[0].vtx[36].setPosition(wrap_points['F1'][0])
-            wrap_fold_pln[0].vtx[38].setPosition(wrap_points['F1b'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[20:40], ch=0)
-            pm.polyDelEdge(wrap_fold_pln[0].e[65], ch=0, cv=1)
+            temp_face = plane.f[14]
+            subdivideFacet(temp_face, duv=2, dvv=2, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                40: wrap_points['F1a'],
+                39: wrap_points['G2'],
+                36: wrap_points['F1'],
+                38: wrap_points['F1b']})
+            mergeVertex(vtx_range % (20, 40), ch=0)
+            delEdge(plane.e[65], ch=0, cv=1)
 
         # Models bottom right diagonal folds
         if not self.wrap_overlap:
-            temp_face = wrap_fold_pln[0].f[5]
-            pm.polySubdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[35].setPosition(wrap_points['H6'][0])
-            wrap_fold_pln[0].vtx[34].setPosition(wrap_points['I7a'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[10:35], ch=0)
+            temp_face = plane.f[5]
+            subdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                35: wrap_points['H6'],
+                34: wrap_points['I7a']})
+            mergeVertex(vtx_range % (10, 35), ch=0)
         else:
-            temp_face = [wrap_fold_pln[0].f[2], wrap_fold_pln[0].f[5]]
-            pm.polySubdivideFacet(temp_face, duv=2, dvv=1, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[40].setPosition(wrap_points['I7b'][0])
-            wrap_fold_pln[0].vtx[39].setPosition(wrap_points['I7b'][0])
-            wrap_fold_pln[0].vtx[7].setPosition(wrap_points['I7a'][0])
-            wrap_fold_pln[0].vtx[6].setPosition(wrap_points['H6'][0])
-            temp_vertex = [wrap_fold_pln[0].vtx[2:3]]
-            temp_vertex.append(wrap_fold_pln[0].vtx[6:7])
-            temp_vertex.append(wrap_fold_pln[0].vtx[10:11])
-            temp_vertex.append(wrap_fold_pln[0].vtx[38:40])
-            pm.polyMergeVertex(temp_vertex, ch=0)
-            pm.polyDelEdge(wrap_fold_pln[0].e[67], ch=0, cv=1)
+            temp_face = [plane.f[2], plane.f[5]]
+            subdivideFacet(temp_face, duv=2, dvv=1, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                40: wrap_points['I7b'],
+                39: wrap_points['I7b'],
+                7: wrap_points['I7a'],
+                6: wrap_points['H6']})
+            mergeVertex([vtx_range % (2, 3), vtx_range % (6, 7), vtx_range % (10, 11), vtx_range % (38, 40)], ch=0)
+            delEdge(plane.e[67], ch=0, cv=1)
 
         # Models bottom left diagonal folds
         if not self.wrap_overlap:
-            temp_face = wrap_fold_pln[0].f[3]
-            pm.polySubdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[35].setPosition(wrap_points['G6'][0])
-            wrap_fold_pln[0].vtx[36].setPosition(wrap_points['F7a'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[9:35], ch=0)
+            temp_face = plane.f[3]
+            subdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                35: wrap_points['G6'],
+                36: wrap_points['F7a']})
+            mergeVertex(vtx_range % (9, 35), ch=0)
         else:
-            temp_face = [wrap_fold_pln[0].f[0], wrap_fold_pln[0].f[3]]
-            pm.polySubdivideFacet(temp_face, duv=2, dvv=1, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[40].setPosition(wrap_points['F7b'][0])
-            wrap_fold_pln[0].vtx[39].setPosition(wrap_points['F7b'][0])
-            wrap_fold_pln[0].vtx[4].setPosition(wrap_points['F7a'][0])
-            wrap_fold_pln[0].vtx[5].setPosition(wrap_points['G6'][0])
-            temp_vertex = [wrap_fold_pln[0].vtx[0:1]]
-            temp_vertex.append(wrap_fold_pln[0].vtx[4:5])
-            temp_vertex.append(wrap_fold_pln[0].vtx[8:9])
-            temp_vertex.append(wrap_fold_pln[0].vtx[38:40])
-            pm.polyMergeVertex(temp_vertex, ch=0)
-            pm.polyDelEdge(wrap_fold_pln[0].e[67], ch=0, cv=1)
+            temp_face = [plane.f[0], plane.f[3]]
+            subdivideFacet(temp_face, duv=2, dvv=1, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                40: wrap_points['F7b'],
+                39: wrap_points['F7b'],
+                4: wrap_points['F7a'],
+                5: wrap_points['G6']})
+            mergeVertex([vtx_range % (0, 1), vtx_range % (4, 5), vtx_range % (8, 9), vtx_range % (38, 40)], ch=0)
+            delEdge(plane.e[67], ch=0, cv=1)
 
         # Model top diagonal fold points F1c, I1c
         if self.wrap_overlap:
-            temp_face = [wrap_fold_pln[0].f[15], wrap_fold_pln[0].f[25]]
-            pm.polySubdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
-            wrap_fold_pln[0].vtx[41].setPosition(wrap_points['I1c'][0])
-            wrap_fold_pln[0].vtx[40].setPosition(wrap_points['I1a'][0])
-            wrap_fold_pln[0].vtx[39].setPosition(wrap_points['F1c'][0])
-            wrap_fold_pln[0].vtx[38].setPosition(wrap_points['F1a'][0])
-            pm.polyMergeVertex(wrap_fold_pln[0].vtx[33:41], ch=0)
-
-        # Store vertex IDs in folding pattern
-        if not self.wrap_overlap:
-            # x = 8
-            wrap_points['F8'][1] = 0
-            wrap_points['G8'][1] = 1
-            wrap_points['H8'][1] = 2
-            wrap_points['I8'][1] = 3
-            # x = 7
-            wrap_points['F7'][1] = 4
-            wrap_points['G7'][1] = 5
-            wrap_points['H7'][1] = 6
-            wrap_points['I7'][1] = 7
-            # diagonal folds x = 7
-            wrap_points['F7a'][1] = 35
-            wrap_points['I7a'][1] = 34
-            # x = 6
-            wrap_points['F6'][1] = 8
-            wrap_points['G6'][1] = 9
-            wrap_points['H6'][1] = 10
-            wrap_points['I6'][1] = 11
-            # x = 5
-            wrap_points['F5'][1] = 12
-            wrap_points['G5'][1] = 13
-            wrap_points['H5'][1] = 14
-            wrap_points['I5'][1] = 15
-            # diagonal folds x = 4
-            wrap_points['F4a'][1] = 31
-            wrap_points['F4b'][1] = 30
-            wrap_points['I4a'][1] = 29
-            wrap_points['I4b'][1] = 28
-            # x = 3
-            wrap_points['F3'][1] = 16
-            wrap_points['G3'][1] = 17
-            wrap_points['H3'][1] = 18
-            wrap_points['I3'][1] = 19
-            # x = 2
-            wrap_points['F2'][1] = 20
-            wrap_points['G2'][1] = 21
-            wrap_points['H2'][1] = 22
-            wrap_points['I2'][1] = 23
-            # x = 1
-            wrap_points['F1'][1] = 24
-            wrap_points['G1'][1] = 25
-            wrap_points['H1'][1] = 26
-            wrap_points['I1'][1] = 27
-            # x = 1 diagonal folds
-            wrap_points['F1a'][1] = 33
-            wrap_points['I1a'][1] = 32
-        else:
-            # x = 7
-            wrap_points['F7'][1] = 0
-            wrap_points['G7'][1] = 1
-            wrap_points['H7'][1] = 2
-            wrap_points['I7'][1] = 3
-            # x = 7 diagonal folds
-            wrap_points['F7a'][1] = 4
-            wrap_points['F7b'][1] = 37
-            wrap_points['I7a'][1] = 7
-            wrap_points['I7b'][1] = 36
-            # x = 6
-            wrap_points['F6'][1] = 8
-            wrap_points['G6'][1] = 5
-            wrap_points['H6'][1] = 6
-            wrap_points['I6'][1] = 9
-            # x = 5
-            wrap_points['F5'][1] = 10
-            wrap_points['G5'][1] = 11
-            wrap_points['H5'][1] = 12
-            wrap_points['I5'][1] = 13
-            # x = 4
-            wrap_points['FG4'][1] = 31
-            wrap_points['F4a'][1] = 29
-            wrap_points['F4b'][1] = 30
-            wrap_points['HI4'][1] = 28
-            wrap_points['I4a'][1] = 26
-            wrap_points['I4b'][1] = 27
-            # x = 3
-            wrap_points['F3'][1] = 14
-            wrap_points['G3'][1] = 15
-            wrap_points['H3'][1] = 16
-            wrap_points['I3'][1] = 17
-            # x = 2
-            wrap_points['F2'][1] = 18
-            wrap_points['G2'][1] = 19
-            wrap_points['H2'][1] = 20
-            wrap_points['I2'][1] = 21
-            # x = 1
-            wrap_points['F1'][1] = 22
-            wrap_points['G1'][1] = 23
-            wrap_points['H1'][1] = 24
-            wrap_points['I1'][1] = 25
-            # x = 1 diagonal folds
-            wrap_points['F1a'][1] = 35
-            wrap_points['F1b'][1] = 34
-            wrap_points['F1c'][1] = 38
-            wrap_points['I1a'][1] = 33
-            wrap_points['I1b'][1] = 32
-            wrap_points['I1c'][1] = 39
-
-        return wrap_fold_pln, wrap_points
+            temp_face = [plane.f[15], plane.f[25]]
+            subdivideFacet(temp_face, duv=1, dvv=2, sbm=1, ch=0)
+            setVertexPositions(plane, {
+                41: wrap_points['I1c'],
+                40: wrap_points['I1a'],
+                39: wrap_points['F1c'],
+                38: wrap_points['F1a']})
+            mergeVertex(vtx_range % (33, 41), ch=0)
+
+        # Store vertex IDs of the folding pattern points
+        vertex_ids = dict(fold_vtx_ids[self.wrap_overlap])
+
+        return wrap_fold_pln, vertex_ids
+
+    def setVertexPositions(self, mesh, positions):
+        """
+        Moves a batch of vertices with a single write to the mesh.
+        positions = dict of vertex ID : position (object space)
+        """
+        sel = om.MSelectionList()
+        sel.add(mesh.getShape().longName())
+        fn_mesh = om.MFnMesh(sel.getDagPath(0))
+        points = fn_mesh.getPoints(om.MSpace.kObject)
+        for vtx_id, pos in positions.items():
+            points[vtx_id] = om.MPoint(pos[0], pos[1], pos[2])
+        fn_mesh.setPoints(points, om.MSpace.kObject)
+        fn_mesh.updateSurface()
+
+    def setCVPositions(self, curve, positions):
+        """
+        Moves a batch of CVs with a single write to the curve.
+        positions = dict of CV ID : position (object space)
+        """
+        sel = om.MSelectionList()
+        sel.add(curve.getShape().longName())
+        fn_curve = om.MFnNurbsCurve(sel.getDagPath(0))
+        points = fn_curve.cvPositions(om.MSpace.kObject)
+        for cv_id, pos in positions.items():
+            points[cv_id] = om.MPoint(pos[0], pos[1], pos[2])
+        if fn_curve.form == om.MFnNurbsCurve.kPeriodic:
+            # The first CVs (one per degree) repeat at the end, keep them in sync
+            for cv_id in range(fn_curve.degree):
+                points[fn_curve.numSpans + cv_id] = points[cv_id]
+        fn_curve.setCVPositions(points, om.MSpace.kObject)
+        fn_curve.updateCurve()
 
     def getFoldingPivots(self, points):
         """
@@ -810,621 +866,254 @@ class GiftWrap(object):
         Var names: 1U = 1st fold, upper quadrant, and so on
         """
         # 1st fold
-        wrap_pivots = {'1U' : (points['I3'][0] + points['F3'][0]) / 2}
-        wrap_pivots['1B'] = (points['I5'][0] + points['F5'][0]) / 2
+        wrap_pivots = {'1U' : (points['I3'] + points['F3']) / 2}
+        wrap_pivots['1B'] = (points['I5'] + points['F5']) / 2
 
         # 2nd fold
-        wrap_pivots['2U'] = wrap_pivots['1U'] + 0 # add zero to copy not ref
-        wrap_pivots['2U'].y += (points['F2'][0].z - points['F3'][0].z) * -1
-
-        wrap_pivots['2B'] = wrap_pivots['2U'] + 0
-        wrap_pivots['2B'].z *= -1
-
-        # 3rd fold
-        wrap_pivots['3UR'] = points['H3'][0] + 0
-        temp = (points['I3'][0].x - points['H3'][0].x)/2
-        wrap_pivots['3UR'].x += temp
-        wrap_pivots['3UR'].z += temp
-        wrap_pivots['3BR'] = points['H5'][0] + 0
-        wrap_pivots['3BR'].x += temp
-        wrap_pivots['3BR'].z -= temp
-        wrap_pivots['3UL'] = points['G3'][0] + 0
-        wrap_pivots['3UL'].x -= temp
-        wrap_pivots['3UL'].z += temp
-        wrap_pivots['3BL'] = points['G5'][0] + 0
-        wrap_pivots['3BL'].x -= temp
-        wrap_pivots['3BL'].z -= temp
-
-        # 4th fold
-        wrap_pivots['4UR'] = wrap_pivots['3UR'] + 0
-        temp = wrap_pivots['2U'].y
-        wrap_pivots['4UR'].y = temp
-        wrap_pivots['4BR'] = wrap_pivots['3BR'] + 0
-        wrap_pivots['4BR'].y = temp
-        wrap_pivots['4UL'] = wrap_pivots['3UL'] + 0
-        wrap_pivots['4UL'].y = temp
-        wrap_pivots['4BL'] = wrap_pivots['3BL'] + 0
-        wrap_pivots['4BL'].y = temp
+        pivot_1U = wrap_pivots['1U']
+        fold_y = pivot_1U.y - (points['F2'].z - points['F3'].z)
+        wrap_pivots['2U'] = dt.Vector(pivot_1U.x, fold_y, pivot_1U.z)
+        wrap_pivots['2B'] = dt.Vector(pivot_1U.x, fold_y, -pivot_1U.z)
+
+        # 3rd fold, offset diagonally from the inner corners
+        temp = (points['I3'].x - points['H3'].x)/2
+        wrap_pivots['3UR'] = points['H3'] + dt.Vector(temp, 0, temp)
+        wrap_pivots['3BR'] = points['H5'] + dt.Vector(temp, 0, -temp)
+        wrap_pivots['3UL'] = points['G3'] + dt.Vector(-temp, 0, temp)
+        wrap_pivots['3BL'] = points['G5'] + dt.Vector(-temp, 0, -temp)
+
+        # 4th fold, same as the 3rd but raised to the 2nd fold
+        for key in ['UR', 'BR', 'UL', 'BL']:
+            pivot_3 = wrap_pivots['3' + key]
+            wrap_pivots['4' + key] = dt.Vector(pivot_3.x, fold_y, pivot_3.z)
 
         # Last two folds
-        wrap_pivots['5R'] = points['H4'][0] + 0
-        wrap_pivots['5R'].y = temp
-        wrap_pivots['5L'] = points['G4'][0] + 0
-        wrap_pivots['5L'].y = temp
+        wrap_pivots['5R'] = dt.Vector(points['H4'].x, fold_y, points['H4'].z)
+        wrap_pivots['5L'] = dt.Vector(points['G4'].x, fold_y, points['G4'].z)
 
-        wrap_pivots['6R'] = points['H4'][0] + 0
-        wrap_pivots['6L'] = points['G4'][0] + 0
+        wrap_pivots['6R'] = dt.Vector(points['H4']) # Copy not reference
+        wrap_pivots['6L'] = dt.Vector(points['G4'])
 
         return wrap_pivots
 
-    def createClusters(self, points, pivots):
+    def createClusters(self, vertex_ids, pivots):
         """
         Create clusters used for folding the plane.
         """
-        # Create lists of rows of vertices to select
-        vertices_x1 = [self.f_plane[0].vtx[points['F1'][1]]]
-        vertices_x1.append(self.f_plane[0].vtx[points['G1'][1]])
-        vertices_x1.append(self.f_plane[0].vtx[points['H1'][1]])
-        vertices_x1.append(self.f_plane[0].vtx[points['I1'][1]])
-
-        vertices_x2 = [self.f_plane[0].vtx[points['F2'][1]]]
-        vertices_x2.append(self.f_plane[0].vtx[points['G2'][1]])
-        vertices_x2.append(self.f_plane[0].vtx[points['H2'][1]])
-        vertices_x2.append(self.f_plane[0].vtx[points['I2'][1]])
-
-        vertices_x3 = [self.f_plane[0].vtx[points['F3'][1]]]
-        vertices_x3.append(self.f_plane[0].vtx[points['G3'][1]])
-        vertices_x3.append(self.f_plane[0].vtx[points['H3'][1]])
-        vertices_x3.append(self.f_plane[0].vtx[points['I3'][1]])
-
-        vertices_x5 = [self.f_plane[0].vtx[points['F5'][1]]]
-        vertices_x5.append(self.f_plane[0].vtx[points['G5'][1]])
-        vertices_x5.append(self.f_plane[0].vtx[points['H5'][1]])
-        vertices_x5.append(self.f_plane[0].vtx[points['I5'][1]])
-
-        vertices_x6 = [self.f_plane[0].vtx[points['F6'][1]]]
-        vertices_x6.append(self.f_plane[0].vtx[points['G6'][1]])
-        vertices_x6.append(self.f_plane[0].vtx[points['H6'][1]])
-        vertices_x6.append(self.f_plane[0].vtx[points['I6'][1]])
-
-        vertices_x7 = [self.f_plane[0].vtx[points['F7'][1]]]
-        vertices_x7.append(self.f_plane[0].vtx[points['G7'][1]])
-        vertices_x7.append(self.f_plane[0].vtx[points['H7'][1]])
-        vertices_x7.append(self.f_plane[0].vtx[points['I7'][1]])
+        # Node names, completed with the fold key, e.g. cluster_name % ('1U',)
+        cluster_name = "gift_%s_cluster_%%s" % (self.wrap_id,)
+        pivot_name = "gift_%s_pivot_%%s" % (self.wrap_id,)
+        pivot_grp_name = "GRP_gift_%s_pivot_%%s" % (self.wrap_id,)
+
+        # Vertex components of the folding pattern points, as plain component
+        # names so no PyMEL MeshVertex objects need to be built
+        plane = self.f_plane[0].longName()
+        vtx = {}
+        for key, vtx_id in vertex_ids.items():
+            vtx[key] = "%s.vtx[%s]" % (plane, vtx_id)
+
+        members = cluster_members[self.wrap_overlap]
+        for key, grp_rotation in fold_clusters:
+            vertices = [vtx[point] for point in members[key]]
+            if grp_rotation is None:
+                cluster = pm.cluster(vertices, n=cluster_name % (key,))
+                cluster[1].setRotatePivot(pivots[key])
+                setattr(self, 'pivot_' + key, cluster[1]) # The cluster's weighted node is its handle
+            else:
+                # Create custom weighted node,(a locator) as pivot
+                pivot = [pm.spaceLocator(p=pivots[key], n=pivot_name % (key,)),None]
+                pivot[1] = pivot[0].getShape()
+                pivot_group = pm.group(pivot[0], n=pivot_grp_name % (key,))
+                pivot_group.rotate.set(grp_rotation)
+                pivot[0].setPivots(pivots[key]) # Center of the locator, no bounding box needed
+                cluster = pm.cluster(vertices, n=cluster_name % (key,))
+                pm.parent(cluster[1], pivot[0])
+                setattr(self, 'pivot_' + key, pivot)
+                setattr(self, 'pivot_%s_group' % (key,), pivot_group)
+            setattr(self, 'cluster_' + key, cluster)
 
-        if not self.wrap_overlap:
-            vertices_x8 = [self.f_plane[0].vtx[points['F8'][1]]]
-            vertices_x8.append(self.f_plane[0].vtx[points['G8'][1]])
-            vertices_x8.append(self.f_plane[0].vtx[points['H8'][1]])
-            vertices_x8.append(self.f_plane[0].vtx[points['I8'][1]])
+        # Parent to main cluster group
+        pm.parent([
+            self.cluster_1U[1],
+            self.cluster_1B[1],
+            self.cluster_2U[1],
+            self.cluster_2B[1],
+            self.pivot_3UR_group,
+            self.pivot_3UL_group,
+            self.pivot_3BR_group,
+            self.pivot_3BL_group,
+            self.pivot_4UR_group,
+            self.pivot_4UL_group,
+            self.pivot_4BR_group,
+            self.pivot_4BL_group,
+            self.cluster_5R[1],
+            self.cluster_5L[1],
+            self.cluster_6R[1],
+            self.cluster_6L[1]
+        ], self.cluster_group)
+
+        # Resolve the fold order once, see foldPaper
+        self.fold_schedule = []
+        for key, attr, angle, fix in fold_order:
+            pivot = getattr(self, 'pivot_' + key)
+            if dict(fold_clusters)[key] is not None:
+                pivot = pivot[0] # Locator
+            if fix is not None:
+                fix *= self.fold_fix
+            reset_fix = fix is not None and not key in fold_fix_kept
+            self.fold_schedule.append((pivot, attr, angle, fix, reset_fix))
 
-        pm.select(None) # Deselect all
+    def idGenerator(self, size=4, chars=string.ascii_uppercase + string.digits):
+        "ID gen - Courtesy of a random google search"
+        if hasattr(random, 'choices'): # Python 3.6+, all in one call
+            return ''.join(random.choices(chars, k=size))
+        return ''.join(random.choice(chars) for x in range(size)) # Python 2 Maya
 
-        # 1st fold
-        # Upper
-        vertices_1U = vertices_x1 + vertices_x2
-        vertices_1U.append(self.f_plane[0].vtx[points['F1a'][1]])
-        vertices_1U.append(self.f_plane[0].vtx[points['I1a'][1]])
+    def foldPaper(self, folds=17):
+        """
+        Wraps / unwraps gift by rotating clusters.
+        folds = number of folds to perform
+        """
+        for fold, (pivot, attr, angle, fix, reset_fix) in enumerate(self.fold_schedule, 1):
+            if folds >= fold:
+                pivot.attr(attr).set(angle)
+                if fix is not None:
+                    pivot.translate.set(fix,0,0)
+            else: # Unfold
+                pivot.rotate.set(0,0,0)
+                if reset_fix:
+                    pivot.translate.set(0,0,0)
 
-        if self.wrap_overlap:
-            vertices_1U.append(self.f_plane[0].vtx[points['F1b'][1]])
-            vertices_1U.append(self.f_plane[0].vtx[points['I1b'][1]])
-            vertices_1U.append(self.f_plane[0].vtx[points['F1c'][1]])
-            vertices_1U.append(self.f_plane[0].vtx[points['I1c'][1]])
-
-        pm.select(vertices_1U)
-        self.cluster_1U = pm.cluster(n="gift_%s_cluster_1U" % (self.wrap_id,))
-        self.cluster_1U[1].setRotatePivot(pivots['1U'])
-        self.pivot_1U = pm.PyNode(self.cluster_1U[0].getWeightedNode())
-
-        # Lower
-        vertices_1B = vertices_x6 + vertices_x7
-        if not self.wrap_overlap:
-            vertices_1B += vertices_x8
+    def setDrivenKeys(self, anim=0):
+        """
+        Connect the wrapping to the animation attribute of the control handle.
+        """
+        with suspendScene(): # Nests in createGiftWrap, the only caller
+            driver = self.ctrl_handle[0].animation
+            setDrivenKeyframe = pm.setDrivenKeyframe # Called for every tick
+            self.foldPaper(0)
+            driver.set(0)
+            setDrivenKeyframe(self.pivot_1B.rotateX, cd=driver)
 
-        vertices_1B.append(self.f_plane[0].vtx[points['F7a'][1]])
-        vertices_1B.append(self.f_plane[0].vtx[points['I7a'][1]])
+            driver.set(1)
+            self.foldPaper(1)
+            setDrivenKeyframe([self.pivot_1B.rotateX, self.pivot_2B.rotateX], cd=driver)
 
-        if self.wrap_overlap:
-            vertices_1B.append(self.f_plane[0].vtx[points['F7b'][1]])
-            vertices_1B.append(self.f_plane[0].vtx[points['I7b'][1]])
+            driver.set(2)
+            self.foldPaper(2)
+            setDrivenKeyframe([self.pivot_2B.rotateX, self.pivot_1U.rotateX], cd=driver)
 
-        pm.select(vertices_1B)
-        self.cluster_1B = pm.cluster(n="gift_%s_cluster_1B" % (self.wrap_id,))
-        self.cluster_1B[1].setRotatePivot(pivots['1B'])
-        self.pivot_1B = pm.PyNode(self.cluster_1B[0].getWeightedNode())
+            driver.set(3)
+            self.foldPaper(3)
+            setDrivenKeyframe([self.pivot_1U.rotateX, self.pivot_2U.rotateX], cd=driver)
 
-        # 2nd fold
-        # Upper
-        vertices_2U = vertices_x1
-        vertices_2U.append(self.f_plane[0].vtx[points['F1a'][1]])
-        vertices_2U.append(self.f_plane[0].vtx[points['I1a'][1]])
+            driver.set(4)
+            self.foldPaper(4)
+            setDrivenKeyframe([self.pivot_2U.rotateX, self.pivot_3UL[0].rotateX, self.pivot_3UL[0].translateX], cd=driver)
 
-        if self.wrap_overlap:
-            vertices_2U.append(self.f_plane[0].vtx[points['F1b'][1]])
-            vertices_2U.append(self.f_plane[0].vtx[points['I1b'][1]])
-            vertices_2U.append(self.f_plane[0].vtx[points['F1c'][1]])
-            vertices_2U.append(self.f_plane[0].vtx[points['I1c'][1]])
-
-        pm.select(vertices_2U)
-        self.cluster_2U = pm.cluster(n="gift_%s_cluster_2U" % (self.wrap_id,))
-        self.cluster_2U[1].setRotatePivot(pivots['2U'])
-        self.pivot_2U = pm.PyNode(self.cluster_2U[0].getWeightedNode())
-        # Lower
-        vertices_2B = vertices_x7
-        if not self.wrap_overlap:
-            vertices_2B += vertices_x8
+            driver.set(4.5)
+            self.foldPaper(5)
+            setDrivenKeyframe([self.pivot_3UL[0].rotateX, self.pivot_3UL[0].translateX, self.pivot_3BL[0].rotateX, self.pivot_3BL[0].translateX], cd=driver)
 
-        vertices_2B.append(self.f_plane[0].vtx[points['F7a'][1]])
-        vertices_2B.append(self.f_plane[0].vtx[points['I7a'][1]])
+            driver.set(5)
+            self.foldPaper(6)
+            setDrivenKeyframe([self.pivot_3BL[0].rotateX, self.pivot_3BL[0].translateX, self.pivot_3UR[0].rotateX, self.pivot_3UR[0].translateX], cd=driver)
 
-        if self.wrap_overlap:
-            vertices_2B.append(self.f_plane[0].vtx[points['F7b'][1]])
-            vertices_2B.append(self.f_plane[0].vtx[points['I7b'][1]])
-
-        pm.select(vertices_2B)
-        self.cluster_2B = pm.cluster(n="gift_%s_cluster_2B" % (self.wrap_id,))
-        self.cluster_2B[1].setRotatePivot(pivots['2B'])
-        self.pivot_2B = pm.PyNode(self.cluster_2B[0].getWeightedNode())
-
-        # 3rd fold
-        # UR
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_3UR = [pm.spaceLocator(p=pivots['3UR'], n="gift_%s_pivot_3UR" % (self.wrap_id,)),None]
-        self.pivot_3UR[1] = self.pivot_3UR[0].getShape()
-        pm.select(self.pivot_3UR[0])
-        self.pivot_3UR_group = pm.group(n="GRP_gift_%s_pivot_3UR" % (self.wrap_id,))
-        self.pivot_3UR_group.rotateY.set(-45)
-        self.pivot_3UR[0].centerPivots()
-        # UR cluster
-        vertices_3UR = [self.f_plane[0].vtx[points['I3'][1]]]
-        if self.wrap_overlap:
-            vertices_3UR.append(self.f_plane[0].vtx[points['I4a'][1]])
-            vertices_3UR.append(self.f_plane[0].vtx[points['I4b'][1]])
-        pm.select(vertices_3UR)
-        self.cluster_3UR = pm.cluster(n="gift_%s_cluster_3UR" % (self.wrap_id,))
-        pm.parent(self.cluster_3UR[1], self.pivot_3UR[0])
-        self.cluster_3UR_pivot = pm.PyNode(self.cluster_3UR[0].getWeightedNode())
-
-        # BR
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_3BR = [pm.spaceLocator(p=pivots['3BR'], n="gift_%s_pivot_3BR" % (self.wrap_id,)),None]
-        self.pivot_3BR[1] = self.pivot_3BR[0].getShape()
-        pm.select(self.pivot_3BR[0])
-        self.pivot_3BR_group = pm.group(n="GRP_gift_%s_pivot_3BR" % (self.wrap_id,))
-        self.pivot_3BR_group.rotate.set(180,225,0)
-        self.pivot_3BR[0].centerPivots()
-        # BR cluster
-        vertices_3BR = [self.f_plane[0].vtx[points['I5'][1]]]
-        if self.wrap_overlap:
-            vertices_3BR.append(self.f_plane[0].vtx[points['I4a'][1]])
-            vertices_3BR.append(self.f_plane[0].vtx[points['I4b'][1]])
-        pm.select(vertices_3BR)
-        self.cluster_3BR = pm.cluster(n="gift_%s_cluster_3BR" % (self.wrap_id,))
-        pm.parent(self.cluster_3BR[1], self.pivot_3BR[0])
-
-        # UL
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_3UL = [pm.spaceLocator(p=pivots['3UL'], n="gift_%s_pivot_3UL" % (self.wrap_id,)),None]
-        self.pivot_3UL[1] = self.pivot_3UL[0].getShape()
-        pm.select(self.pivot_3UL[0])
-        self.pivot_3UL_group = pm.group(n="GRP_gift_%s_pivot_3UL" % (self.wrap_id,))
-        self.pivot_3UL_group.rotateY.set(45)
-        self.pivot_3UL[0].centerPivots()
-        # UL cluster
-        vertices_3UL = [self.f_plane[0].vtx[points['F3'][1]]]
-        if self.wrap_overlap:
-            vertices_3UL.append(self.f_plane[0].vtx[points['F4a'][1]])
-            vertices_3UL.append(self.f_plane[0].vtx[points['F4b'][1]])
-        pm.select(vertices_3UL)
-        self.cluster_3UL = pm.cluster(n="gift_%s_cluster_3UL" % (self.wrap_id,))
-        pm.parent(self.cluster_3UL[1], self.pivot_3UL[0])
-
-        # BL
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_3BL = [pm.spaceLocator(p=pivots['3BL'], n="gift_%s_pivot_3BL" % (self.wrap_id,)),None]
-        self.pivot_3BL[1] = self.pivot_3BL[0].getShape()
-        pm.select(self.pivot_3BL[0])
-        self.pivot_3BL_group = pm.group(n="GRP_gift_%s_pivot_3BL" % (self.wrap_id,))
-        self.pivot_3BL_group.rotate.set(0,45,180)
-        self.pivot_3BL[0].centerPivots()
-        # BL cluster
-        vertices_3BL = [self.f_plane[0].vtx[points['F5'][1]]]
-        if self.wrap_overlap:
-            vertices_3BL.append(self.f_plane[0].vtx[points['F4a'][1]])
-            vertices_3BL.append(self.f_plane[0].vtx[points['F4b'][1]])
-        pm.select(vertices_3BL)
-        self.cluster_3BL = pm.cluster(n="gift_%s_cluster_3BL" % (self.wrap_id,))
-        pm.parent(self.cluster_3BL[1], self.pivot_3BL[0])
-
-        # 4th fold
-        # UR
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_4UR = [pm.spaceLocator(p=pivots['4UR'], n="gift_%s_pivot_4UR" % (self.wrap_id,)),None]
-        self.pivot_4UR[1] = self.pivot_4UR[0].getShape()
-        pm.select(self.pivot_4UR[0])
-        self.pivot_4UR_group = pm.group(n="GRP_gift_%s_pivot_4UR" % (self.wrap_id,))
-        self.pivot_4UR_group.rotateY.set(135)
-        self.pivot_4UR[0].centerPivots()
-        # UR cluster
-        vertices_4UR = [self.f_plane[0].vtx[points['I2'][1]]]
-        if self.wrap_overlap:
-            vertices_4UR.append(self.f_plane[0].vtx[points['I1b'][1]])
-            vertices_4UR.append(self.f_plane[0].vtx[points['I7'][1]])
-        pm.select(vertices_4UR)
-        self.cluster_4UR = pm.cluster(n="gift_%s_cluster_4UR" % (self.wrap_id,))
-        pm.parent(self.cluster_4UR[1], self.pivot_4UR[0])
-        self.cluster_4UR_pivot = pm.PyNode(self.cluster_4UR[0].getWeightedNode())
-
-        # BR
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_4BR = [pm.spaceLocator(p=pivots['4BR'], n="gift_%s_pivot_4BR" % (self.wrap_id,)),None]
-        self.pivot_4BR[1] = self.pivot_4BR[0].getShape()
-        pm.select(self.pivot_4BR[0])
-        self.pivot_4BR_group = pm.group(n="GRP_gift_%s_pivot_4BR" % (self.wrap_id,))
-        self.pivot_4BR_group.rotateY.set(45)
-        self.pivot_4BR[0].centerPivots()
-        # BR cluster
-        vertices_4BR = [self.f_plane[0].vtx[points['I6'][1]]]
-        if self.wrap_overlap:
-            vertices_4BR.append(self.f_plane[0].vtx[points['I7a'][1]])
-            vertices_4BR.append(self.f_plane[0].vtx[points['I1'][1]])
-            vertices_4BR.append(self.f_plane[0].vtx[points['I7'][1]])
-
-        pm.select(vertices_4BR)
-        self.cluster_4BR = pm.cluster(n="gift_%s_cluster_4BR" % (self.wrap_id,))
-        pm.parent(self.cluster_4BR[1], self.pivot_4BR[0])
-
-        # UL
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_4UL = [pm.spaceLocator(p=pivots['4UL'], n="gift_%s_pivot_4UL" % (self.wrap_id,)),None]
-        self.pivot_4UL[1] = self.pivot_4UL[0].getShape()
-        pm.select(self.pivot_4UL[0])
-        self.pivot_4UL_group = pm.group(n="GRP_gift_%s_pivot_4UL" % (self.wrap_id,))
-        self.pivot_4UL_group.rotateY.set(225)
-        self.pivot_4UL[0].centerPivots()
-        # UL cluster
-        vertices_4UL = [self.f_plane[0].vtx[points['F2'][1]]]
-        if self.wrap_overlap:
-            vertices_4UL.append(self.f_plane[0].vtx[points['F1b'][1]])
-            vertices_4UL.append(self.f_plane[0].vtx[points['F7'][1]])
-        pm.select(vertices_4UL)
-        self.cluster_4UL = pm.cluster(n="gift_%s_cluster_4UL" % (self.wrap_id,))
-        pm.parent(self.cluster_4UL[1], self.pivot_4UL[0])
-
-        # BL
-        # Create custom weighted node,(a locator) as pivot
-        self.pivot_4BL = [pm.spaceLocator(p=pivots['4BL'], n="gift_%s_pivot_4BL" % (self.wrap_id,)),None]
-        self.pivot_4BL[1] = self.pivot_4BL[0].getShape()
-        pm.select(self.pivot_4BL[0])
-        self.pivot_4BL_group = pm.group(n="GRP_gift_%s_pivot_4BL" % (self.wrap_id,))
-        self.pivot_4BL_group.rotate.set(180,225,180)
-        self.pivot_4BL[0].centerPivots()
-        # BL cluster
-        vertices_4BL = [self.f_plane[0].vtx[points['F6'][1]]]
-        if self.wrap_overlap:
-            vertices_4BL.append(self.f_plane[0].vtx[points['F7a'][1]])
-            vertices_4BL.append(self.f_plane[0].vtx[points['F1'][1]])
-            vertices_4BL.append(self.f_plane[0].vtx[points['F7'][1]])
+            driver.set(5.5)
+            self.foldPaper(7)
+            setDrivenKeyframe([self.pivot_3UR[0].rotateX, self.pivot_3UR[0].translateX, self.pivot_3BR[0].rotateX, self.pivot_3BR[0].translateX], cd=driver)
 
-        pm.select(vertices_4BL)
-        self.cluster_4BL = pm.cluster(n="gift_%s_cluster_4BL" % (self.wrap_id,))
-        pm.parent(self.cluster_4BL[1], self.pivot_4BL[0])
+            driver.set(6)
+            self.foldPaper(8)
+            setDrivenKeyframe([self.pivot_3BR[0].rotateX, self.pivot_3BR[0].translateX, self.pivot_4UL[0].rotateX], cd=driver)
 
-        # 6th fold
-        # Right
-        vertices_6R = [self.f_plane[0].vtx[points['I4a'][1]], self.f_plane[0].vtx[points['I4b'][1]]]
-        if self.wrap_overlap:
-            vertices_6R.append(self.f_plane[0].vtx[points['HI4'][1]])
-        pm.select(vertices_6R)
-        self.cluster_6R = pm.cluster(n="gift_%s_cluster_6R" % (self.wrap_id,))
-        self.cluster_6R[1].setRotatePivot(pivots['6R'])
-        self.pivot_6R = pm.PyNode(self.cluster_6R[0].getWeightedNode())
-        # Left
-        vertices_6L = [self.f_plane[0].vtx[points['F4a'][1]], self.f_plane[0].vtx[points['F4b'][1]]]
-        if self.wrap_overlap:
-            vertices_6L.append(self.f_plane[0].vtx[points['FG4'][1]])
-        pm.select(vertices_6L)
-        self.cluster_6L = pm.cluster(n="gift_%s_cluster_6L" % (self.wrap_id,))
-        self.cluster_6L[1].setRotatePivot(pivots['6L'])
-        self.pivot_6L = pm.PyNode(self.cluster_6L[0].getWeightedNode())
-
-        # 6th fold
-        # Right
-        vertices_5R = [self.f_plane[0].vtx[points['I7'][1]]]
-        vertices_5R.append(self.f_plane[0].vtx[points['I1'][1]])
-        vertices_5R.append(self.f_plane[0].vtx[points['I1a'][1]])
-        vertices_5R.append(self.f_plane[0].vtx[points['I7a'][1]])
-        if not self.wrap_overlap:
-            vertices_5R.append(self.f_plane[0].vtx[points['I8'][1]])
-        else:
-            vertices_5R.append(self.f_plane[0].vtx[points['I7b'][1]])
-            vertices_5R.append(self.f_plane[0].vtx[points['I1b'][1]])
-            vertices_5R.append(self.f_plane[0].vtx[points['I1c'][1]])
-
-        pm.select(vertices_5R)
-        self.cluster_5R = pm.cluster(n="gift_%s_cluster_5R" % (self.wrap_id,))
-        self.cluster_5R[1].setRotatePivot(pivots['5R'])
-        self.pivot_5R = pm.PyNode(self.cluster_5R[0].getWeightedNode())
-        # Left
-        vertices_5L = [self.f_plane[0].vtx[points['F7'][1]]]
-        vertices_5L.append(self.f_plane[0].vtx[points['F1'][1]])
-        vertices_5L.append(self.f_plane[0].vtx[points['F1a'][1]])
-        vertices_5L.append(self.f_plane[0].vtx[points['F7a'][1]])
-        if not self.wrap_overlap:
-            vertices_5L.append(self.f_plane[0].vtx[points['F8'][1]])
-        else:
-            vertices_5L.append(self.f_plane[0].vtx[points['F7b'][1]])
-            vertices_5L.append(self.f_plane[0].vtx[points['F1b'][1]])
-            vertices_5L.append(self.f_plane[0].vtx[points['F1c'][1]])
-        pm.select(vertices_5L)
-        self.cluster_5L = pm.cluster(n="gift_%s_cluster_5L" % (self.wrap_id,))
-        self.cluster_5L[1].setRotatePivot(pivots['5L'])
-        self.pivot_5L = pm.PyNode(self.cluster_5L[0].getWeightedNode())
+            driver.set(6.5)
+            self.foldPaper(9)
+            setDrivenKeyframe([self.pivot_4UL[0].rotateX, self.pivot_4BL[0].rotateX], cd=driver)
 
-        # Parent to main cluster group
-        pm.parent(self.cluster_1U[1], self.cluster_group)
-        pm.parent(self.cluster_1B[1], self.cluster_group)
-        pm.parent(self.cluster_2U[1], self.cluster_group)
-        pm.parent(self.cluster_2B[1], self.cluster_group)
-        pm.parent(self.pivot_3UR_group, self.cluster_group)
-        pm.parent(self.pivot_3UL_group, self.cluster_group)
-        pm.parent(self.pivot_3BR_group, self.cluster_group)
-        pm.parent(self.pivot_3BL_group, self.cluster_group)
-        pm.parent(self.pivot_4UR_group, self.cluster_group)
-        pm.parent(self.pivot_4UL_group, self.cluster_group)
-        pm.parent(self.pivot_4BR_group, self.cluster_group)
-        pm.parent(self.pivot_4BL_group, self.cluster_group)
-        pm.parent(self.cluster_5R[1], self.cluster_group)
-        pm.parent(self.cluster_5L[1], self.cluster_group)
-        pm.parent(self.cluster_6R[1], self.cluster_group)
-        pm.parent(self.cluster_6L[1], self.cluster_group)
+            driver.set(7)
+            self.foldPaper(10)
+            setDrivenKeyframe([self.pivot_4BL[0].rotateX, self.pivot_4UR[0].rotateX], cd=driver)
 
-    def idGenerator(self, size=4, chars=string.ascii_uppercase + string.digits):
-        "ID gen - Courtesy of a random google search"
-        return ''.join(random.choice(chars) for x in range(size))
+            driver.set(7.5)
+            self.foldPaper(11)
+            setDrivenKeyframe([self.pivot_4UR[0].rotateX, self.pivot_4BR[0].rotateX], cd=driver)
 
-    def foldPaper(self, folds=17):
-        """
-        Wraps / unwraps gift by rotating clusters.
-        folds = number of folds to perform
-        """
-        if folds >= 1:
-            self.pivot_1B.rotateX.set(-90)
-        if folds >= 2:
-            self.pivot_2B.rotateX.set(-90)
-        if folds >= 3:
-            self.pivot_1U.rotateX.set(90)
-        if folds >= 4:
-            self.pivot_2U.rotateX.set(89.8)
-        if folds >= 5:
-            self.pivot_3UL[0].rotateX.set(178)
-            self.pivot_3UL[0].translate.set(self.fold_fix,0,0) # fix
-        if folds >= 6:
-            self.pivot_3BL[0].rotateX.set(178)
-            self.pivot_3BL[0].translate.set(self.fold_fix*-1,0,0)
-        if folds >= 7:
-            self.pivot_3UR[0].rotateX.set(178)
-            self.pivot_3UR[0].translate.set(self.fold_fix*-1,0,0)
-        if folds >= 8:
-            self.pivot_3BR[0].rotateX.set(178)
-            self.pivot_3BR[0].translate.set(self.fold_fix,0,0)
-        if folds >= 9:
-            self.pivot_4UL[0].rotateX.set(178)
-        if folds >= 10:
-            self.pivot_4BL[0].rotateX.set(178)
-        if folds >= 11:
-            self.pivot_4UR[0].rotateX.set(178)
-        if folds >= 12:
-            self.pivot_4BR[0].rotateX.set(178)
-        if folds >= 13:
-            self.pivot_5L.rotateZ.set(86)
-        if folds >= 14:
-            self.pivot_5R.rotateZ.set(-86)
-        if folds >= 15:
-            self.pivot_6L.rotateZ.set(-84)
-        if folds >= 16:
-            self.pivot_6R.rotateZ.set(84)
-
-        if folds == 0:
-            self.pivot_1B.rotate.set(0,0,0)
-        if folds < 2:
-            self.pivot_2B.rotate.set(0,0,0)
-        if folds < 3:
-            self.pivot_1U.rotate.set(0,0,0)
-        if folds < 4:
-            self.pivot_2U.rotate.set(0,0,0)
-        if folds < 5:
-            self.pivot_3UL[0].rotate.set(0,0,0)
-            self.pivot_3UL[0].translate.set(0,0,0)
-        if folds < 6:
-            self.pivot_3BL[0].rotate.set(0,0,0)
-            self.pivot_3BL[0].translate.set(0,0,0)
-        if folds < 7:
-            self.pivot_3UR[0].rotate.set(0,0,0)
-        if folds < 8:
-            self.pivot_3BR[0].rotate.set(0,0,0)
-        if folds < 9:
-            self.pivot_4UL[0].rotate.set(0,0,0)
-        if folds < 10:
-            self.pivot_4BL[0].rotate.set(0,0,0)
-        if folds < 11:
-            self.pivot_4UR[0].rotate.set(0,0,0)
-        if folds < 12:
-            self.pivot_4BR[0].rotate.set(0,0,0)
-        if folds < 13:
-            self.pivot_5L.rotate.set(0,0,0)
-        if folds < 14:
-            self.pivot_5R.rotate.set(0,0,0)
-        if folds < 15:
-            self.pivot_6L.rotate.set(0,0,0)
-        if folds < 16:
-            self.pivot_6R.rotate.set(0,0,0)
+            driver.set(8)
+            self.foldPaper(12)
+            setDrivenKeyframe([self.pivot_4BR[0].rotateX, self.pivot_5L.rotateZ], cd=driver)
 
-    def setDrivenKeys(self, anim=0):
-        """
-        Connect the wrapping to the animation attribute of the control handle.
-        """
-        self.foldPaper(0)
-        self.ctrl_handle[0].animation.set(0)
-        pm.setDrivenKeyframe(self.pivot_1B.rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(1)
-        self.foldPaper(1)
-        pm.setDrivenKeyframe(self.pivot_1B.rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_2B.rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(2)
-        self.foldPaper(2)
-        pm.setDrivenKeyframe(self.pivot_2B.rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_1U.rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(3)
-        self.foldPaper(3)
-        pm.setDrivenKeyframe(self.pivot_1U.rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_2U.rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(4)
-        self.foldPaper(4)
-        pm.setDrivenKeyframe(self.pivot_2U.rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3UL[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3UL[0].translateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(4.5)
-        self.foldPaper(5)
-        pm.setDrivenKeyframe(self.pivot_3UL[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3UL[0].translateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3BL[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3BL[0].translateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(5)
-        self.foldPaper(6)
-        pm.setDrivenKeyframe(self.pivot_3BL[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3BL[0].translateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3UR[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3UR[0].translateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(5.5)
-        self.foldPaper(7)
-        pm.setDrivenKeyframe(self.pivot_3UR[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3UR[0].translateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3BR[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3BR[0].translateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(6)
-        self.foldPaper(8)
-        pm.setDrivenKeyframe(self.pivot_3BR[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_3BR[0].translateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_4UL[0].rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(6.5)
-        self.foldPaper(9)
-        pm.setDrivenKeyframe(self.pivot_4UL[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_4BL[0].rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(7)
-        self.foldPaper(10)
-        pm.setDrivenKeyframe(self.pivot_4BL[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_4UR[0].rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(7.5)
-        self.foldPaper(11)
-        pm.setDrivenKeyframe(self.pivot_4UR[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_4BR[0].rotateX, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(8)
-        self.foldPaper(12)
-        pm.setDrivenKeyframe(self.pivot_4BR[0].rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_5L.rotateZ, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(8.5)
-        self.foldPaper(13)
-        pm.setDrivenKeyframe(self.pivot_5L.rotateZ, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_5R.rotateZ, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(9)
-        self.foldPaper(14)
-        pm.setDrivenKeyframe(self.pivot_5R.rotateZ, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_6L.rotateZ, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(9.5)
-        self.foldPaper(15)
-        pm.setDrivenKeyframe(self.pivot_6L.rotateZ, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.pivot_6R.rotateZ, cd=self.ctrl_handle[0].animation)
-
-
-        self.ctrl_handle[0].animation.set(10)
-        self.foldPaper(16)
-
-        bbox_minmax = self.wrap_gift.boundingBoxMax.get() - self.wrap_gift.boundingBoxMin.get()
-
-        self.gift_group.translateY.set(0)
-        self.gift_group.rotateX.set(0)
-        self.gift_group.centerPivots()
-
-        pm.setDrivenKeyframe(self.pivot_6R.rotateZ, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.gift_group.rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.gift_group.translateY, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(10.5)
-        self.gift_group.translateY.set(bbox_minmax[1]/2)
-        pm.setDrivenKeyframe(self.gift_group.translateY, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(11)
-        self.gift_group.rotateX.set(180)
-        self.gift_group.translateY.set(0)
-        self.tieRibbon(0)
-        pm.setDrivenKeyframe(self.gift_group.rotateX, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.gift_group.translateY, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['1U'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['1D'][2].maxValue, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(12)
-        self.tieRibbon(1)
-        pm.setDrivenKeyframe(self.ribbons['1U'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['1D'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['2L'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['2R'][2].maxValue, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(13)
-        self.tieRibbon(2)
-        pm.setDrivenKeyframe(self.ribbons['2L'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['2R'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['3L'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['3R'][2].maxValue, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(14)
-        self.tieRibbon(3)
-        pm.setDrivenKeyframe(self.ribbons['3L'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['3R'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['4'][2].maxValue, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(15)
-        self.tieRibbon(4)
-        pm.setDrivenKeyframe(self.ribbons['3L'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['3R'][2].maxValue, cd=self.ctrl_handle[0].animation)
-        pm.setDrivenKeyframe(self.ribbons['4'][2].maxValue, cd=self.ctrl_handle[0].animation)
-
-        self.ctrl_handle[0].animation.set(anim)
+            driver.set(8.5)
+            self.foldPaper(13)
+            setDrivenKeyframe([self.pivot_5L.rotateZ, self.pivot_5R.rotateZ], cd=driver)
+
+            driver.set(9)
+            self.foldPaper(14)
+            setDrivenKeyframe([self.pivot_5R.rotateZ, self.pivot_6L.rotateZ], cd=driver)
+
+            driver.set(9.5)
+            self.foldPaper(15)
+            setDrivenKeyframe([self.pivot_6L.rotateZ, self.pivot_6R.rotateZ], cd=driver)
+
+
+            driver.set(10)
+            self.foldPaper(16)
+
+            bbox_size = self.gift_bbox_size
+
+            self.gift_group.translateY.set(0)
+            self.gift_group.rotateX.set(0)
+            self.gift_group.centerPivots()
+
+            setDrivenKeyframe([self.pivot_6R.rotateZ, self.gift_group.rotateX, self.gift_group.translateY], cd=driver)
+
+            driver.set(10.5)
+            self.gift_group.translateY.set(bbox_size[1]/2)
+            setDrivenKeyframe(self.gift_group.translateY, cd=driver)
+
+            driver.set(11)
+            self.gift_group.rotateX.set(180)
+            self.gift_group.translateY.set(0)
+            self.tieRibbon(0)
+            setDrivenKeyframe([self.gift_group.rotateX, self.gift_group.translateY, self.ribbons['1U'][2].maxValue, self.ribbons['1D'][2].maxValue], cd=driver)
+
+            driver.set(12)
+            self.tieRibbon(1, 0)
+            setDrivenKeyframe([self.ribbons['1U'][2].maxValue, self.ribbons['1D'][2].maxValue, self.ribbons['2L'][2].maxValue, self.ribbons['2R'][2].maxValue], cd=driver)
+
+            driver.set(13)
+            self.tieRibbon(2, 1)
+            setDrivenKeyframe([self.ribbons['2L'][2].maxValue, self.ribbons['2R'][2].maxValue, self.ribbons['3L'][2].maxValue, self.ribbons['3R'][2].maxValue], cd=driver)
+
+            driver.set(14)
+            self.tieRibbon(3, 2)
+            setDrivenKeyframe([self.ribbons['3L'][2].maxValue, self.ribbons['3R'][2].maxValue, self.ribbons['4'][2].maxValue], cd=driver)
+
+            driver.set(15)
+            self.tieRibbon(4, 3)
+            setDrivenKeyframe([self.ribbons['3L'][2].maxValue, self.ribbons['3R'][2].maxValue, self.ribbons['4'][2].maxValue], cd=driver)
+
+            driver.set(anim)
 
     def setAnimation(self, anim_s=None, anim_e=None):
+        ctrl = self.ctrl_handle[0]
         if anim_s is None:
             anim_s = self.animation_start
         else:
             self.animation_start = anim_s
-            self.ctrl_handle[0].animation_start.set(self.animation_start)
+            ctrl.animation_start.set(self.animation_start)
         if anim_e is None :
             anim_e = self.animation_end
         else:
             self.animation_end = anim_e
-            self.ctrl_handle[0].animation_end.set(self.animation_end)
+            ctrl.animation_end.set(self.animation_end)
 
-        pm.cutKey(self.ctrl_handle[0], at='animation', cl=True)
+        pm.cutKey(ctrl, at='animation', cl=True)
 
         if not anim_s == anim_e:
-            pm.setKeyframe(self.ctrl_handle[0], at='animation', v=0,
+            pm.setKeyframe(ctrl, at='animation', v=0,
                            t=anim_s)
-            pm.setKeyframe(self.ctrl_handle[0], at='animation', v=15,
+            pm.setKeyframe(ctrl, at='animation', v=15,
                            t=anim_e)
 
     def createPaper(self, plane, thickness):
@@ -1432,18 +1121,17 @@ class GiftWrap(object):
         Creates a wrapping paper mesh which is then controlled by the
         folding plane using a wrap deformer.
         """
-        paper = pm.duplicate(plane, name="wrap_paper_%s" % self.wrap_id)
+        paper = pm.duplicate(plane, name=self.getNodeName('paper'))
+        paper_longName = paper[0].longName() # maya.cmds from here, no PyNode results
         # Make hipoly
-        pm.polyBevel(paper, o=0.005, ch=0)
-        pm.polySubdivideFacet(paper, dv=1, dvv=1, sbm=0, ch=0, m=1)
+        mc.polyBevel(paper_longName, o=0.005, ch=0)
+        mc.polySubdivideFacet(paper_longName, dv=1, dvv=1, sbm=0, ch=0, m=1)
         #pm.polySmooth(paper, mth=0, dv=1, ch=0, kt=False)
         paper[0].rotatePivot.translate.set(0,thickness/2,0)
         paper[0].translateY.set(thickness/2)
-        pm.polyExtrudeFacet(paper, translateY=(thickness * -1), ch=0)
-        verts = pm.polyEvaluate(paper[0], f=True) - 1
-        evalthis = 'polyProjection -ch 0 -type Planar -ibd on -kir  -md y ' + str(paper[0]) + '.f[0:' + str(verts) +']'
-
-        mel.eval(evalthis) # UV planar map
+        mc.polyExtrudeFacet(paper_longName, translateY=(thickness * -1), ch=0)
+        verts = mc.polyEvaluate(paper_longName, f=True) - 1
+        mc.polyProjection('%s.f[0:%s]' % (paper_longName, verts), ch=0, type='Planar', ibd=True, kir=True, md='y') # UV planar map
 
         # Create wrap deformer
         pm.select(None)
@@ -1467,289 +1155,21 @@ class GiftWrap(object):
                          /
                         (D)ownside
         """
-        # x, y, z from origin
-        y_pos = side_h + (r_thickness / 3)
-        x_pos = (side_w / 2) + (r_thickness + thickness)
-        z_pos = (side_d / 2) + (r_thickness / 3)
-        edg_m = thickness / 2 # edge margin
-        mid_c = 0.5 # mid point coefficient
-        end_m = 2 * thickness # end point margin
-        x_pos_m = thickness # width (L and R) margin
-        x_edge = (side_a / 2) #+ thickness + (r_thickness / 2)
-
-
-        # Mid points
-        r_points = {'U' : [dt.Vector(0, y_pos, 0), 0]}
-        r_points['D'] = [dt.Vector(0, 0, 0), 0]
-        r_points['L'] = [dt.Vector(0 - x_pos, side_h / 2, 0), 0]
-        r_points['R'] = [dt.Vector(x_pos, side_h / 2, 0), 0]
-        r_points['F'] = [dt.Vector(0, side_d / 2, z_pos), 0]
-        r_points['B'] = [dt.Vector(0, side_d / 2, 0 - z_pos), 0]
-
-        # Upper side
-        r_points['UL'] = [r_points['U'][0] + 0, 0] # Copy not reference
-        r_points['UL'][0].x = 0 - x_edge
-        r_points['ULmid'] = [r_points['UL'][0] + 0, 0]
-        r_points['ULmid'][0].x *= mid_c
-        r_points['ULend'] = [r_points['UL'][0] + 0, 0]
-        r_points['ULend'][0].x += end_m * 2
-
-        r_points['UR'] = [r_points['U'][0] + 0, 0]
-        r_points['UR'][0].x = x_edge
-        r_points['URmid'] = [r_points['UR'][0] + 0, 0]
-        r_points['URmid'][0].x *= mid_c
-        r_points['URend'] = [r_points['UR'][0] + 0, 0]
-        r_points['URend'][0].x -= end_m * 2
-
-        r_points['UB'] = [r_points['U'][0] + 0, 0]
-        r_points['UB'][0].z = r_points['B'][0].z + edg_m
-        r_points['UBmid'] = [r_points['UB'][0] + 0, 0]
-        r_points['UBmid'][0].z *= mid_c
-        r_points['UBend'] = [r_points['UB'][0] + 0, 0]
-        r_points['UBend'][0].z += end_m
-
-        r_points['UF'] = [r_points['U'][0] + 0, 0]
-        r_points['UF'][0].z = r_points['F'][0].z - edg_m
-        r_points['UFmid'] = [r_points['UF'][0] + 0, 0]
-        r_points['UFmid'][0].z *= mid_c
-        r_points['UFend'] = [r_points['UF'][0] + 0, 0]
-        r_points['UFend'][0].z -= end_m
-
-        # Downside
-        r_points['DL'] = [r_points['D'][0] + 0, 0]
-        r_points['DL'][0].x = 0 - x_edge
-        r_points['DLmid'] = [r_points['DL'][0] + 0, 0]
-        r_points['DLmid'][0].x *= mid_c
-        r_points['DLend'] = [r_points['DL'][0] + 0, 0]
-        r_points['DLend'][0].x += end_m * 2
-
-        r_points['DR'] = [r_points['D'][0] + 0, 0]
-        r_points['DR'][0].x = x_edge
-        r_points['DRmid'] = [r_points['DR'][0] + 0, 0]
-        r_points['DRmid'][0].x *= mid_c
-        r_points['DRend'] = [r_points['DR'][0] + 0, 0]
-        r_points['DRend'][0].x -= end_m * 2
-
-        r_points['DB'] = [r_points['D'][0] + 0, 0]
-        r_points['DB'][0].z = r_points['B'][0].z + edg_m
-        r_points['DBmid'] = [r_points['DB'][0] + 0, 0]
-        r_points['DBmid'][0].z *= mid_c
-        r_points['DBend'] = [r_points['DB'][0] + 0, 0]
-        r_points['DBend'][0].z += end_m
-
-        r_points['DF'] = [r_points['D'][0] + 0, 0]
-        r_points['DF'][0].z = r_points['F'][0].z - edg_m
-        r_points['DFmid'] = [r_points['DF'][0] + 0, 0]
-        r_points['DFmid'][0].z *= mid_c
-        r_points['DFend'] = [r_points['DF'][0] + 0, 0]
-        r_points['DFend'][0].z -= end_m
-
-        # Left side
-        r_points['LU'] = [r_points['L'][0] + 0, 0]
-        r_points['LU'][0].y = r_points['U'][0].y - edg_m
-        r_points['LU'][0].x = 0 - (x_edge + x_pos_m)
-        r_points['LUmid'] = [r_points['L'][0] + 0, 0]
-        r_points['LUmid'][0].y += y_pos / 4
-        r_points['LUmid'][0].x += (r_points['LU'][0].x  - r_points['L'][0].x) / 2
-        r_points['LUend'] = [r_points['LU'][0] + 0, 0]
-        r_points['LUend'][0].y -= end_m
-        r_points['LUend'][0].x -= x_pos_m
-
-        r_points['LD'] = [r_points['L'][0] + 0, 0]
-        r_points['LD'][0].y = r_points['D'][0].y + edg_m
-        r_points['LD'][0].x = 0 - (x_edge + x_pos_m)
-        r_points['LDmid'] = [r_points['L'][0] + 0, 0]
-        r_points['LDmid'][0].y -= y_pos / 3
-        r_points['LDend'] = [r_points['LD'][0] + 0, 0]
-        r_points['LDend'][0].y += end_m
-        r_points['LDend'][0].x -= x_pos_m
-
-        r_points['LB'] = [r_points['L'][0] + 0, 0]
-        r_points['LB'][0].z = r_points['B'][0].z + edg_m
-        r_points['LBmid'] = [r_points['LB'][0] + 0, 0]
-        r_points['LBmid'][0].z *= mid_c
-        r_points['LBend'] = [r_points['LB'][0] + 0, 0]
-        r_points['LBend'][0].z += end_m
-
-        r_points['LF'] = [r_points['L'][0] + 0, 0]
-        r_points['LF'][0].z = r_points['F'][0].z - edg_m
-        r_points['LFmid'] = [r_points['LF'][0] + 0, 0]
-        r_points['LFmid'][0].z *= mid_c
-        r_points['LFend'] = [r_points['LF'][0] + 0, 0]
-        r_points['LFend'][0].z -= end_m
-
-        # Right side
-        r_points['RU'] = [r_points['R'][0] + 0, 0]
-        r_points['RU'][0].y = r_points['U'][0].y - edg_m
-        r_points['RU'][0].x = x_edge + x_pos_m
-        r_points['RUmid'] = [r_points['R'][0] + 0, 0]
-        r_points['RUmid'][0].y += y_pos / 4
-        r_points['RUmid'][0].x -= (r_points['R'][0].x  - r_points['RU'][0].x) / 2
-        r_points['RUend'] = [r_points['RU'][0] + 0, 0]
-        r_points['RUend'][0].y -= end_m
-        r_points['RUend'][0].x += x_pos_m
-
-        r_points['RD'] = [r_points['R'][0] + 0, 0]
-        r_points['RD'][0].y = r_points['D'][0].y + edg_m
-        r_points['RD'][0].x = x_edge + x_pos_m
-        r_points['RDmid'] = [r_points['R'][0] + 0, 0]
-        r_points['RDmid'][0].y -= y_pos / 3
-        r_points['RDend'] = [r_points['RD'][0] + 0, 0]
-        r_points['RDend'][0].y += end_m
-        r_points['RDend'][0].x += x_pos_m
-
-        r_points['RB'] = [r_points['R'][0] + 0, 0]
-        r_points['RB'][0].z = r_points['B'][0].z + edg_m
-        r_points['RBmid'] = [r_points['RB'][0] + 0, 0]
-        r_points['RBmid'][0].z *= mid_c
-        r_points['RBend'] = [r_points['RB'][0] + 0, 0]
-        r_points['RBend'][0].z += end_m
-
-        r_points['RF'] = [r_points['R'][0] + 0, 0]
-        r_points['RF'][0].z = r_points['F'][0].z - edg_m
-        r_points['RFmid'] = [r_points['RF'][0] + 0, 0]
-        r_points['RFmid'][0].z *= mid_c
-        r_points['RFend'] = [r_points['RF'][0] + 0, 0]
-        r_points['RFend'][0].z -= end_m
-
-        # Back side
-        r_points['BU'] = [r_points['B'][0] + 0, 0]
-        r_points['BU'][0].y = r_points['U'][0].y - edg_m
-        r_points['BUmid'] = [r_points['BU'][0] + 0, 0]
-        r_points['BUmid'][0].y -= y_pos / 4
-        r_points['BUend'] = [r_points['BU'][0] + 0, 0]
-        r_points['BUend'][0].y -= end_m
-
-        r_points['BD'] = [r_points['B'][0] + 0, 0]
-        r_points['BD'][0].y = r_points['D'][0].y + edg_m
-        r_points['BDmid'] = [r_points['BD'][0] + 0, 0]
-        r_points['BDmid'][0].y += y_pos / 4
-        r_points['BDend'] = [r_points['BD'][0] + 0, 0]
-        r_points['BDend'][0].y += end_m
-
-        r_points['BL'] = [r_points['B'][0] + 0, 0]
-        r_points['BL'][0].x = r_points['L'][0].x + edg_m
-        r_points['BLmid'] = [r_points['BL'][0] + 0, 0]
-        r_points['BLmid'][0].x *= mid_c
-        r_points['BLend'] = [r_points['BL'][0] + 0, 0]
-        r_points['BLend'][0].x += end_m
-
-        r_points['BR'] = [r_points['B'][0] + 0, 0]
-        r_points['BR'][0].x = r_points['R'][0].x - edg_m
-        r_points['BRmid'] = [r_points['BR'][0] + 0, 0]
-        r_points['BRmid'][0].x *= mid_c
-        r_points['BRend'] = [r_points['BR'][0] + 0, 0]
-        r_points['BRend'][0].x -= end_m
-
-        # Front side
-        r_points['FU'] = [r_points['F'][0] + 0, 0]
-        r_points['FU'][0].y = r_points['U'][0].y - edg_m
-        r_points['FUmid'] = [r_points['FU'][0] + 0, 0]
-        r_points['FUmid'][0].y -= y_pos / 4
-        r_points['FUend'] = [r_points['FU'][0] + 0, 0]
-        r_points['FUend'][0].y -= end_m
-
-        r_points['FD'] = [r_points['F'][0] + 0, 0]
-        r_points['FD'][0].y = r_points['D'][0].y + edg_m
-        r_points['FDmid'] = [r_points['FD'][0] + 0, 0]
-        r_points['FDmid'][0].y += y_pos / 4
-        r_points['FDend'] = [r_points['FD'][0] + 0, 0]
-        r_points['FDend'][0].y += end_m
-
-        r_points['FL'] = [r_points['F'][0] + 0, 0]
-        r_points['FL'][0].x = r_points['L'][0].x + edg_m
-        r_points['FLmid'] = [r_points['FL'][0] + 0, 0]
-        r_points['FLmid'][0].x *= mid_c
-        r_points['FLend'] = [r_points['FL'][0] + 0, 0]
-        r_points['FLend'][0].x += end_m
-
-        r_points['FR'] = [r_points['F'][0] + 0, 0]
-        r_points['FR'][0].x = r_points['R'][0].y - edg_m
-        r_points['FRmid'] = [r_points['FR'][0] + 0, 0]
-        r_points['FRmid'][0].x *= mid_c
-        r_points['FRend'] = [r_points['FR'][0] + 0, 0]
-        r_points['FRend'][0].x -= end_m
-
-        # Bow
+        r_coords = getRibbonCoordinates(side_w, side_h, side_d, side_a, thickness, r_thickness, r_width)
 
-        loop_w = side_w / 3
-        loop_h = side_w / 4
-
-        # Left loop
-        r_points['bow_L1'] = [r_points['U'][0] + 0, 0]
-        r_points['bow_L2'] = [r_points['U'][0] + 0, 0]
-        r_points['bow_L2'][0].x = 0 - loop_w
-        r_points['bow_L2'][0].y += r_thickness
-        r_points['bow_L3'] = [r_points['bow_L2'][0] + 0, 0]
-        r_points['bow_L3'][0].y += loop_h / 2
-        r_points['bow_L3'][0].x -= r_width / 2
-        r_points['bow_L4'] = [r_points['bow_L2'][0] + 0, 0]
-        r_points['bow_L4'][0].y += loop_h
-        r_points['bow_L4'][0].x += r_width * 0.25
-        r_points['bow_L5'] = [r_points['bow_L1'][0] + 0, 0]
-        r_points['bow_L5'][0].y += r_thickness
-        r_points['bow_L5'][0].x -= r_width * 0.85
-        r_points['bow_L6'] = [r_points['bow_L5'][0] + 0, 0]
-        r_points['bow_L6'][0].x += r_width / 2
-        r_points['bow_L7'] = [r_points['bow_L1'][0] + 0, 0]
-        r_points['bow_L7'][0].y += r_thickness * 0.5
-
-        # Right loop
-        r_points['bow_R1'] = [r_points['U'][0] + 0, 0]
-        r_points['bow_R2'] = [r_points['U'][0] + 0, 0]
-        r_points['bow_R2'][0].x = loop_w
-        r_points['bow_R2'][0].y += r_thickness
-        r_points['bow_R3'] = [r_points['bow_R2'][0] + 0, 0]
-        r_points['bow_R3'][0].y += loop_h / 2
-        r_points['bow_R3'][0].x += r_width / 2
-        r_points['bow_R4'] = [r_points['bow_R2'][0] + 0, 0]
-        r_points['bow_R4'][0].y += loop_h
-        r_points['bow_R4'][0].x -= r_width * 0.25
-        r_points['bow_R5'] = [r_points['bow_R1'][0] + 0, 0]
-        r_points['bow_R5'][0].y += r_thickness
-        r_points['bow_R5'][0].x += r_width * 0.85
-        r_points['bow_R6'] = [r_points['bow_R5'][0] + 0, 0]
-        r_points['bow_R6'][0].x -= r_width / 2
-        r_points['bow_R7'] = [r_points['bow_R1'][0] + 0, 0]
-        r_points['bow_R7'][0].y += r_thickness * 0.5
-
-        # Knot
-        r_points['knot_1'] = [r_points['U'][0] + 0, 0]
-        r_points['knot_1'][0].z += r_width / 2
-        r_points['knot_2'] = [r_points['knot_1'][0] + 0, 0]
-        r_points['knot_2'][0].y += r_thickness * 2
-        r_points['knot_3'] = [r_points['U'][0] + 0, 0]
-        r_points['knot_3'][0].y += r_thickness * 2
-        r_points['knot_4'] = [r_points['knot_2'][0] + 0, 0]
-        r_points['knot_4'][0].z -= r_width*1.5
-        r_points['knot_4'][0].y += r_width*0.15
-        r_points['knot_5'] = [r_points['U'][0] + 0, 0]
-        r_points['knot_5'][0].z -= r_width / 2
-
-        # Ends
-        # Left end
-        r_points['end_L1'] = [r_points['U'][0] + 0, 0]
-        r_points['end_L1'][0].z += r_width / 2
+        r_points = {}
+        Vector = dt.Vector
+        for key, coords in r_coords.items():
+            r_points[key] = Vector(coords)
 
         return r_points
 
     def getRibbonWidth(self, r_size, side_d, side_e):
         """Calcuclate width of ribbon"""
-        if side_d > side_e :
-            smallest_side = side_e
-        else:
-            smallest_side = side_d
-
-        r_width_s = smallest_side * 0.09
-
-        if r_size == 'L':
-            r_width = r_width_s * 4.0
-        if r_size == 'M':
-            r_width = r_width_s * 2.5
-        if r_size == 'S':
-            r_width = r_width_s
+        if not r_size in ribbon_size_scale:
+            raise ValueError('Unknown ribbon size "%s"' % (r_size,))
 
-        return r_width
+        return min(side_d, side_e) * 0.09 * ribbon_size_scale[r_size]
 
     def createRibbon(self, r_points, r_thickness, r_width):
         """
@@ -1758,183 +1178,77 @@ class GiftWrap(object):
         Secondly, create a ribbon profile shape and extrude it
         along the curves.
         """
+        # Node names, completed with the ribbon key, e.g. curve_name % ('1U',)
+        curve_name = "ribbon_%%s_crv_%s" % (self.wrap_id,)
+        profile_name = "ribbon_%%s_profile_%s" % (self.wrap_id,)
+        extrude_name = "ribbon_ext_%%s%s" % (self.wrap_id,)
+
         # Curves
-        crv_list_1U = [r_points['U'][0]]
-        crv_list_1U.append(r_points['UBmid'][0])
-        crv_list_1U.append(r_points['UBend'][0])
-        crv_list_1U.append(r_points['UB'][0])
-        crv_list_1U.append(r_points['BU'][0])
-        crv_list_1U.append(r_points['BUend'][0])
-        crv_list_1U.append(r_points['BUmid'][0])
-        crv_list_1U.append(r_points['B'][0])
-        crv_list_1U.append(r_points['BDmid'][0])
-        crv_list_1U.append(r_points['BDend'][0])
-        crv_list_1U.append(r_points['BD'][0])
-        crv_list_1U.append(r_points['DB'][0])
-        crv_list_1U.append(r_points['DBend'][0])
-        crv_list_1U.append(r_points['DBmid'][0])
-        crv_list_1U.append(r_points['D'][0])
-
-        crv_list_1D = [r_points['U'][0]]
-        crv_list_1D.append(r_points['UFmid'][0])
-        crv_list_1D.append(r_points['UFend'][0])
-        crv_list_1D.append(r_points['UF'][0])
-        crv_list_1D.append(r_points['FU'][0])
-        crv_list_1D.append(r_points['FUend'][0])
-        crv_list_1D.append(r_points['FUmid'][0])
-        crv_list_1D.append(r_points['F'][0])
-        crv_list_1D.append(r_points['FDmid'][0])
-        crv_list_1D.append(r_points['FDend'][0])
-        crv_list_1D.append(r_points['FD'][0])
-        crv_list_1D.append(r_points['DF'][0])
-        crv_list_1D.append(r_points['DFend'][0])
-        crv_list_1D.append(r_points['DFmid'][0])
-        crv_list_1D.append(r_points['D'][0])
-
-        crv_list_2L = [r_points['D'][0]]
-        crv_list_2L.append(r_points['DLmid'][0])
-        crv_list_2L.append(r_points['DLend'][0])
-        crv_list_2L.append(r_points['DL'][0])
-        crv_list_2L.append(r_points['LD'][0])
-        crv_list_2L.append(r_points['LDend'][0])
-        crv_list_2L.append(r_points['LDmid'][0])
-        crv_list_2L.append(r_points['L'][0])
-        crv_list_2L.append(r_points['LUmid'][0])
-        crv_list_2L.append(r_points['LUend'][0])
-        crv_list_2L.append(r_points['LU'][0])
-        crv_list_2L.append(r_points['UL'][0])
-        crv_list_2L.append(r_points['ULend'][0])
-        crv_list_2L.append(r_points['ULmid'][0])
-        crv_list_2L.append(r_points['U'][0])
-
-        crv_list_2R = [r_points['D'][0]]
-        crv_list_2R.append(r_points['DRmid'][0])
-        crv_list_2R.append(r_points['DRend'][0])
-        crv_list_2R.append(r_points['DR'][0])
-        crv_list_2R.append(r_points['RD'][0])
-        crv_list_2R.append(r_points['RDend'][0])
-        crv_list_2R.append(r_points['RDmid'][0])
-        crv_list_2R.append(r_points['R'][0])
-        crv_list_2R.append(r_points['RUmid'][0])
-        crv_list_2R.append(r_points['RUend'][0])
-        crv_list_2R.append(r_points['RU'][0])
-        crv_list_2R.append(r_points['UR'][0])
-        crv_list_2R.append(r_points['URend'][0])
-        crv_list_2R.append(r_points['URmid'][0])
-        crv_list_2R.append(r_points['U'][0])
-    
-        crv_list_3L = [r_points['bow_L1'][0]]
-        crv_list_3L.append(r_points['bow_L2'][0])
-        crv_list_3L.append(r_points['bow_L3'][0])
-        crv_list_3L.append(r_points['bow_L4'][0])
-        crv_list_3L.append(r_points['bow_L5'][0])
-        crv_list_3L.append(r_points['bow_L6'][0])
-        crv_list_3L.append(r_points['bow_L7'][0])
-
-        crv_list_3R = [r_points['bow_R1'][0]]
-        crv_list_3R.append(r_points['bow_R2'][0])
-        crv_list_3R.append(r_points['bow_R3'][0])
-        crv_list_3R.append(r_points['bow_R4'][0])
-        crv_list_3R.append(r_points['bow_R5'][0])
-        crv_list_3R.append(r_points['bow_R6'][0])
-
-        crv_list_4 = [r_points['knot_1'][0]]
-        crv_list_4.append(r_points['knot_2'][0])
-        crv_list_4.append(r_points['knot_3'][0])
-        crv_list_4.append(r_points['knot_4'][0])
-        crv_list_4.append(r_points['knot_5'][0])
-
-        curve_1U = pm.curve(p=crv_list_1U, n="ribbon_1U_crv_%s" % (self.wrap_id,))
-        curve_1D = pm.curve(p=crv_list_1D, n="ribbon_1D_crv_%s" % (self.wrap_id,))
-        curve_2L = pm.curve(p=crv_list_2L, n="ribbon_2L_crv_%s" % (self.wrap_id,))
-        curve_2R = pm.curve(p=crv_list_2R, n="ribbon_2R_crv_%s" % (self.wrap_id,))
-        curve_3L = pm.curve(p=crv_list_3L, n="ribbon_3L_crv_%s" % (self.wrap_id,))
-        curve_3R = pm.curve(p=crv_list_3R, n="ribbon_3R_crv_%s" % (self.wrap_id,))
-        curve_4 = pm.curve(p=crv_list_4, n="ribbon_4_crv_%s" % (self.wrap_id,))
-
-        curves = [curve_1U, curve_1D]
+        curves = {}
+        for key, crv_points in ribbon_curves:
+            curves[key] = pm.curve(p=[r_points[p] for p in crv_points], n=curve_name % (key,))
 
         # Ribbon profile shape
-        r_prof_1 = pm.circle(n="ribbon_1_profile_" + self.wrap_id)
-        r_prof_1[0].cv[0].setPosition([r_width/2,r_thickness/2,0])
-        r_prof_1[0].cv[6].setPosition([r_width/2,0,0])
-        r_prof_1[0].cv[7].setPosition([r_width/2,0-(r_thickness/2),0])
-        r_prof_1[0].cv[1].setPosition([0,r_thickness/2,0])
-        r_prof_1[0].cv[2].setPosition([0-(r_width/2),r_thickness/2,0])
-        r_prof_1[0].cv[3].setPosition([0-(r_width/2),0,0])
-        r_prof_1[0].cv[4].setPosition([0-(r_width/2),0-(r_thickness/2),0])
-        r_prof_1[0].cv[5].setPosition([0,0-(r_thickness/2),0])
+        r_prof_1 = pm.circle(n=profile_name % ('1',))
+        self.setCVPositions(r_prof_1[0], {
+            0: [r_width/2,r_thickness/2,0],
+            6: [r_width/2,0,0],
+            7: [r_width/2,0-(r_thickness/2),0],
+            1: [0,r_thickness/2,0],
+            2: [0-(r_width/2),r_thickness/2,0],
+            3: [0-(r_width/2),0,0],
+            4: [0-(r_width/2),0-(r_thickness/2),0],
+            5: [0,0-(r_thickness/2),0]
+        })
         r_prof_1[0].centerPivots()
-        r_prof_1[0].translate.set(r_points['U'][0])
+        r_prof_1[0].translate.set(r_points['U'])
 
-        r_prof_2 = pm.instance(r_prof_1[0], n="ribbon_2_profile_" + self.wrap_id)
+        r_prof_2 = pm.instance(r_prof_1[0], n=profile_name % ('2',))
         r_prof_2[0].rotateY.set(90)
-        r_prof_2[0].translateY.set(r_points['D'][0].y)
+        r_prof_2[0].translateY.set(r_points['D'].y)
 
         # Bow
         bow_rot = 10
-        r_prof_3L = pm.instance(r_prof_1[0], n="ribbon_3L_profile_" + self.wrap_id)
+        r_prof_3L = pm.instance(r_prof_1[0], n=profile_name % ('3L',))
         r_prof_3L[0].rotateY.set(90 + bow_rot)
-        curve_3L.rotateY.set(0 - bow_rot)
+        curves['3L'].rotateY.set(0 - bow_rot)
 
-        r_prof_3R = pm.instance(r_prof_1[0], n="ribbon_3R_profile_" + self.wrap_id)
+        r_prof_3R = pm.instance(r_prof_1[0], n=profile_name % ('3R',))
         r_prof_3R[0].rotateY.set(90 - bow_rot)
-        curve_3R.rotateY.set(0 + bow_rot)
+        curves['3R'].rotateY.set(0 + bow_rot)
 
-        r_prof_4 = pm.instance(r_prof_1[0], n="ribbon_4_profile_" + self.wrap_id)
+        r_prof_4 = pm.instance(r_prof_1[0], n=profile_name % ('4',))
         r_prof_4[0].translateZ.set(r_width / 2)
 
-        r_extrude_1U = pm.extrude(r_prof_1[0], curve_1U, et=2, rn=True, n="ribbon_ext_1U" + self.wrap_id)
-        r_extrude_1D = pm.extrude(r_prof_1[0], curve_1D, et=2, rn=True, n="ribbon_ext_1D" + self.wrap_id)
-        r_extrude_2L = pm.extrude(r_prof_2[0], curve_2L, et=2, rn=True, n="ribbon_ext_2L" + self.wrap_id)
-        r_extrude_2R = pm.extrude(r_prof_2[0], curve_2R, et=2, rn=True, n="ribbon_ext_2R" + self.wrap_id)
-        r_extrude_3L = pm.extrude(r_prof_3L[0], curve_3L, et=2, rn=True, n="ribbon_ext_3L" + self.wrap_id)
-        r_extrude_3R = pm.extrude(r_prof_3R[0], curve_3R, et=2, rn=True, n="ribbon_ext_3R" + self.wrap_id)
-        r_extrude_4 = pm.extrude(r_prof_4[0], curve_4, et=2, rn=True, n="ribbon_ext_4" + self.wrap_id)
-
-        # Make ribbons taper
-        r_extrude_3L[1].scale.set(0.8)
-        r_extrude_3R[1].scale.set(0.8)
-        r_extrude_4[1].scale.set(0.3)
-
-        ribbons = {'1U' : [curve_1U, r_extrude_1U, pm.listConnections(r_extrude_1U, type="subCurve")[1]]}
-        ribbons['1D'] = [curve_1D, r_extrude_1D, pm.listConnections(r_extrude_1D, type="subCurve")[1]]
-        ribbons['2L'] = [curve_2L, r_extrude_2L, pm.listConnections(r_extrude_2L, type="subCurve")[1]]
-        ribbons['2R'] = [curve_2R, r_extrude_2R, pm.listConnections(r_extrude_2R, type="subCurve")[1]]
-        ribbons['3L'] = [curve_3L, r_extrude_3L, pm.listConnections(r_extrude_3L, type="subCurve")[1]]
-        ribbons['3R'] = [curve_3R, r_extrude_3R, pm.listConnections(r_extrude_3R, type="subCurve")[1]]
-        ribbons['4'] = [curve_4, r_extrude_4, pm.listConnections(r_extrude_4, type="subCurve")[1]]
+        # Profile and taper of each ribbon, None = no taper
+        profiles = {'1U' : (r_prof_1, None), '1D' : (r_prof_1, None),
+                    '2L' : (r_prof_2, None), '2R' : (r_prof_2, None),
+                    '3L' : (r_prof_3L, 0.8), '3R' : (r_prof_3R, 0.8),
+                    '4' : (r_prof_4, 0.3)}
+
+        ribbons = {}
+        for key, crv_points in ribbon_curves:
+            r_prof, taper = profiles[key]
+            r_extrude = pm.extrude(r_prof[0], curves[key], et=2, rn=True, n=extrude_name % (key,))
+            if taper is not None:
+                r_extrude[1].scale.set(taper)
+            ribbons[key] = [curves[key], r_extrude, pm.listConnections(r_extrude[1], type="subCurve")[1]]
 
         # Parent to main ribbon group
-        pm.parent(curve_1U, self.r_curve_group)
-        pm.parent(curve_1D, self.r_curve_group)
-        pm.parent(curve_2L, self.r_curve_group)
-        pm.parent(curve_2R, self.r_curve_group)
-        pm.parent(curve_3L, self.r_curve_group)
-        pm.parent(curve_3R, self.r_curve_group)
-        pm.parent(curve_4, self.r_curve_group)
-        pm.parent(r_extrude_1U[0], self.ribbon_group)
-        pm.parent(r_extrude_1D[0], self.ribbon_group)
-        pm.parent(r_extrude_2L[0], self.ribbon_group)
-        pm.parent(r_extrude_2R[0], self.ribbon_group)
-        pm.parent(r_extrude_3L[0], self.ribbon_group)
-        pm.parent(r_extrude_3R[0], self.ribbon_group)
-        pm.parent(r_extrude_4[0], self.ribbon_group)
-        pm.parent(r_prof_1[0], self.r_curve_group)
-        pm.parent(r_prof_2[0], self.r_curve_group)
-        pm.parent(r_prof_3L[0], self.r_curve_group)
-        pm.parent(r_prof_3R[0], self.r_curve_group)
-        pm.parent(r_prof_4[0], self.r_curve_group)
+        pm.parent([curves[key] for key, crv_points in ribbon_curves], self.r_curve_group)
+        pm.parent([ribbons[key][1][0] for key, crv_points in ribbon_curves], self.ribbon_group)
+        pm.parent([r_prof_1[0], r_prof_2[0], r_prof_3L[0], r_prof_3R[0], r_prof_4[0]], self.r_curve_group)
         
         return ribbons, r_prof_1;
 
     def getObjectSides(self):
         """Get height, width and depth from boundingbox of just the object"""
-        bbox_minmax = self.wrap_gift.boundingBoxMax.get() - self.wrap_gift.boundingBoxMin.get()
+        bbox_size = mc.getAttr('%s.boundingBoxSize' % (self.wrap_gift,))[0]
+        self.gift_bbox_size = bbox_size # Gift stays put until moveBack
 
-        side_a = abs(bbox_minmax[0]) # width
-        side_d = abs(bbox_minmax[1]) # height
-        side_e = abs(bbox_minmax[2]) # depth
+        side_a = abs(bbox_size[0]) # width
+        side_d = abs(bbox_size[1]) # height
+        side_e = abs(bbox_size[2]) # depth
 
         return side_a, side_d, side_e
 
@@ -1948,51 +1262,36 @@ class GiftWrap(object):
 
         return side_w, side_h, side_d
 
-    def tieRibbon(self, seg):
+    def tieRibbon(self, seg, tied=None):
         """
         Ties / unties the ribbon by modifying the curve extrusions.
         The process is divided into segments = seg
+        tied = segment the ribbon is at, only segments that change are set
         """
-        if seg >= 1:
-            self.ribbons['1U'][2].maxValue.set(1)
-            self.ribbons['1D'][2].maxValue.set(1)
-        if seg >= 2:
-            self.ribbons['2L'][2].maxValue.set(1)
-            self.ribbons['2R'][2].maxValue.set(1)
-        if seg >= 3:
-            self.ribbons['3L'][2].maxValue.set(1)
-            self.ribbons['3R'][2].maxValue.set(1)
-        if seg >= 4:
-            self.ribbons['4'][2].maxValue.set(1)
-
-        if seg == 0:
-            self.ribbons['1U'][2].maxValue.set(0)
-            self.ribbons['1D'][2].maxValue.set(0)
-        if seg < 2:
-            self.ribbons['2L'][2].maxValue.set(0)
-            self.ribbons['2R'][2].maxValue.set(0)
-        if seg < 3:
-            self.ribbons['3L'][2].maxValue.set(0)
-            self.ribbons['3R'][2].maxValue.set(0)
-        if seg < 4:
-            self.ribbons['4'][2].maxValue.set(0)
+        for i, keys in enumerate(ribbon_tie_order):
+            state = int(i < seg)
+            if tied is not None and state == int(i < tied):
+                continue # Already tied / untied
+            for key in keys:
+                self.ribbons[key][2].maxValue.set(state)
 
     def applyColor(self, color=None):
         """
         Set color of the wrapping paper and ribbon.
         """
-        paper_shader = 'shd_paper_' + self.wrap_color.upper()
-        pm.sets(paper_shader, edit=True, forceElement=self.wrap_paper[0])
-
-        ribbon_shader = 'shd_ribbon_' + self.ribbon_color.upper()
+        paper_name = shader_names[1][self.wrap_color]
+        ribbon_name = shader_names[2][self.ribbon_color]
 
         if type(self.ribbons) is dict:
-            ribbon = []
-            for key in self.ribbons:
-                ribbon.append(self.ribbons[key][1][0])
+            ribbon = [r[1][0].longName() for r in self.ribbons.values()]
         else:
-            ribbon = self.ribbons
-        pm.sets(ribbon_shader, edit=True, forceElement=ribbon)
+            ribbon = [r.longName() for r in self.ribbons]
+
+        with suspendScene(): # No redraw between the two assignments
+            createShaders([paper_name, ribbon_name]) # Only the ones in use
+            # maya.cmds takes the members first, unlike pm.sets
+            mc.sets(self.wrap_paper[0].longName(), edit=True, forceElement='shd_' + paper_name)
+            mc.sets(ribbon, edit=True, forceElement='shd_' + ribbon_name)
 
     def newColor(self, p_color='', r_color=''):
         """
@@ -2007,40 +1306,363 @@ class GiftWrap(object):
 
     def changeRibbon(self, size='S'):
         if size != self.ribbon_size:
-            old_size = self.ribbon_size
+            if not (self.ribbon_size, size) in ribbon_size_change:
+                raise ValueError('Unknown ribbon size "%s"' % (size,))
+            mult = ribbon_size_change[(self.ribbon_size, size)]
             self.ribbon_size = size
             self.storeCtrlValues()
 
-            if old_size == 'S' and size == 'L':
-                mult = 3.5
-            if old_size == 'S' and size == 'M':
-                mult = 2.5
-            if old_size == 'M' and size == 'S':
-                mult = 0.4
-            if old_size == 'M' and size == 'L':
-                mult = 1.4
-            if old_size == 'L' and size == 'S':
-                mult = 0.25
-            if old_size == 'L' and size == 'M':
-                mult = 0.625
-
             for prof in self.ribbon_prof:
-                scale = prof.scale.get()
-                scale.x *= mult
-                prof.scale.set(scale)
+                scale_x = '%s.scaleX' % (prof.longName(),)
+                mc.setAttr(scale_x, mc.getAttr(scale_x) * mult)
 
     def reloadGiftWrap(self):
-        self.removeGiftWrap()
-        self.createGiftWrap(self.wrap_gift)
+        with suspendScene(): # Remove and rebuild as a single undo step
+            self.removeGiftWrap()
+            self.createGiftWrap(self.wrap_gift)
+
+@contextmanager
+def suspendScene():
+    """
+    Suspends viewport refresh, parallel evaluation, cycle checks, auto
+    keying, command echoing and Script Editor info/result output while
+    wraps are built or edited, undoes as a single step.
+    Can be nested, only the outermost call changes any settings.
+    """
+    global scene_suspended
+    if scene_suspended:
+        scene_suspended += 1
+        try:
+            yield
+        finally:
+            scene_suspended -= 1
+        return
+
+    # Store current settings
+    eval_mode = mc.evaluationManager(q=True, mode=True)[0]
+    cycle_check = mc.cycleCheck(q=True, evaluation=True)
+    auto_key = mc.autoKeyframe(q=True, state=True)
+    cmd_echo = mc.commandEcho(q=True, state=True)
+    suppress_info = mc.scriptEditorInfo(q=True, suppressInfo=True)
+    suppress_results = mc.scriptEditorInfo(q=True, suppressResults=True)
+
+    scene_suspended = 1
+    mc.undoInfo(openChunk=True)
+    mc.refresh(suspend=True)
+    mc.evaluationManager(mode='off')
+    mc.cycleCheck(evaluation=False)
+    mc.autoKeyframe(state=False)
+    mc.commandEcho(state=False)
+    mc.scriptEditorInfo(suppressInfo=True, suppressResults=True) # Warnings still show
+    try:
+        yield
+    finally:
+        # Restore settings
+        mc.scriptEditorInfo(suppressInfo=suppress_info, suppressResults=suppress_results)
+        mc.commandEcho(state=cmd_echo)
+        mc.autoKeyframe(state=auto_key)
+        mc.cycleCheck(evaluation=cycle_check)
+        mc.evaluationManager(mode=eval_mode)
+        mc.refresh(suspend=False)
+        mc.undoInfo(closeChunk=True)
+        scene_suspended = 0
+        mc.refresh()
+
+def getFoldingCoordinates(gft_side_a, gft_side_d, gft_side_e, gft_thick):
+    """
+    Finds the coordinates for the wrapping folds, plain arithmetic
+    that doesn't touch the scene.
+    Returns whether the folds overlap and a dict of point name : (x, y, z)
+    """
+    # y-axis
+    y_gft = gft_thick / 2
+
+    # calculate sides
+    gft_side_a += gft_thick
+    gft_side_d += gft_thick
+    gft_side_b = gft_side_d * 0.6
+    gft_side_c = gft_side_e / 2 + y_gft
+    gft_side_e += gft_thick # needs to be run last
+
+    # check if folds will overlap
+    if gft_side_e < (2 * gft_side_b):
+        wrap_overlap = True
+    else:
+        wrap_overlap = False
+
+    # calculate side f, also the offset of the overlapping diagonal folds
+    if not wrap_overlap:
+        gft_side_f = gft_side_c - gft_side_b
+    else:
+        gft_side_f = gft_side_b - gft_side_c
+    gft_side_f2 = gft_side_f * 2
+
+    # x-axis
+    x_h = (gft_side_a / 2)
+    x_i = x_h + gft_side_b
+    x_g = x_h * -1
+    x_f = x_i * -1
+
+    # y-axis
+    z_5 = (gft_side_e / 2)
+    z_6 = z_5 + gft_side_d
+    z_7 = z_6 + gft_side_c
+    z_3 = z_5 * -1
+    z_2 = z_6 * -1
+
+    # calculate z-1 axis
+    if not wrap_overlap:
+        z_1 = z_7 * -1
+    else:
+        z_1 = z_2 - gft_side_b
+
+    # calculate z-8 axis
+    if not wrap_overlap:
+        z_8 = z_7 + gft_side_f
+    else:
+        z_8 = z_7
+
+    # Coordinates in world space
+    # Grid points, columns F-I along x, rows 1-8 along z
+    fold_x = (('F', x_f), ('G', x_g), ('H', x_h), ('I', x_i))
+    fold_z = ((1, z_1), (2, z_2), (3, z_3), (4, 0.0),
+              (5, z_5), (6, z_6), (7, z_7), (8, z_8))
+    fold_coords = {}
+    for col, x in fold_x:
+        for row, z in fold_z:
+            fold_coords['%s%d' % (col, row)] = (x, y_gft, z)
+
+    # calculate diagonal folds F4a, F4b, I4a, I4b
+    fold_coords['I4a'] = (x_i, y_gft, z_3 + gft_side_b)
+    fold_coords['I4b'] = (x_i, y_gft, z_5 - gft_side_b)
+    fold_coords['F4a'] = (x_f, y_gft, z_3 + gft_side_b)
+    fold_coords['F4b'] = (x_f, y_gft, z_5 - gft_side_b)
+
+    # calculate intersecting points HI4, FG4
+    if wrap_overlap:
+        fold_coords['HI4'] = (x_h + z_5, y_gft, 0.0)
+        fold_coords['FG4'] = (x_g - z_5, y_gft, 0.0)
+
+    # calculate diagonal folds F1a, I1a
+    if not wrap_overlap:
+        fold_coords['I1a'] = (x_i, y_gft, z_2 - gft_side_b)
+        fold_coords['F1a'] = (x_f, y_gft, z_2 - gft_side_b)
+    else:
+        fold_coords['I1a'] = (x_i - gft_side_f, y_gft, z_1 + gft_side_f)
+        fold_coords['F1a'] = (x_f + gft_side_f, y_gft, z_1 + gft_side_f)
+
+    # calculate diagonal folds F1b, I1b
+    if wrap_overlap:
+        fold_coords['I1b'] = (x_i, y_gft, z_1 + gft_side_f2)
+        fold_coords['F1b'] = (x_f, y_gft, z_1 + gft_side_f2)
+
+    # calculate diagonal folds F1c, I1c
+    if wrap_overlap:
+        fold_coords['I1c'] = (x_i - gft_side_f2, y_gft, z_1)
+        fold_coords['F1c'] = (x_f + gft_side_f2, y_gft, z_1)
+
+    # calculate diagonal folds F7a, I7a
+    if not wrap_overlap:
+        fold_coords['I7a'] = (x_i, y_gft, z_6 + gft_side_b)
+        fold_coords['F7a'] = (x_f, y_gft, z_6 + gft_side_b)
+    else:
+        fold_coords['I7a'] = (x_i, y_gft, z_7 - gft_side_f)
+        fold_coords['F7a'] = (x_f, y_gft, z_7 - gft_side_f)
+
+    # calculate diagonal folds F7b, I7b
+    if wrap_overlap:
+        fold_coords['I7b'] = (x_i - gft_side_f, y_gft, z_7)
+        fold_coords['F7b'] = (x_f + gft_side_f, y_gft, z_7)
+
+    return wrap_overlap, fold_coords
+
+def getRibbonCoordinates(side_w, side_h, side_d, side_a, thickness, r_thickness, r_width):
+    """
+    Finds the coordinates of the ribbon curves, plain arithmetic
+    that doesn't touch the scene, see GiftWrap.getRibbonPoints.
+    Returns a dict of point name : [x, y, z]
+    """
+    # x, y, z from origin
+    y_pos = side_h + (r_thickness / 3)
+    x_pos = (side_w / 2) + (r_thickness + thickness)
+    z_pos = (side_d / 2) + (r_thickness / 3)
+    edg_m = thickness / 2 # edge margin
+    mid_c = 0.5 # mid point coefficient
+    end_m = 2 * thickness # end point margin
+    x_pos_m = thickness # width (L and R) margin
+    x_edge = (side_a / 2) #+ thickness + (r_thickness / 2)
+
+
+    # Mid points
+    r_points = {'U' : [0, y_pos, 0]}
+    r_points['D'] = [0, 0, 0]
+    r_points['L'] = [0 - x_pos, side_h / 2, 0]
+    r_points['B'] = [0, side_d / 2, 0 - z_pos]
+
+    # Upper side
+    r_points['UL'] = list(r_points['U']) # Copy not reference
+    r_points['UL'][0] = 0 - x_edge
+    r_points['ULmid'] = list(r_points['UL'])
+    r_points['ULmid'][0] *= mid_c
+    r_points['ULend'] = list(r_points['UL'])
+    r_points['ULend'][0] += end_m * 2
+
+    r_points['UB'] = list(r_points['U'])
+    r_points['UB'][2] = r_points['B'][2] + edg_m
+    r_points['UBmid'] = list(r_points['UB'])
+    r_points['UBmid'][2] *= mid_c
+    r_points['UBend'] = list(r_points['UB'])
+    r_points['UBend'][2] += end_m
+
+    # Downside
+    r_points['DL'] = list(r_points['D'])
+    r_points['DL'][0] = 0 - x_edge
+    r_points['DLmid'] = list(r_points['DL'])
+    r_points['DLmid'][0] *= mid_c
+    r_points['DLend'] = list(r_points['DL'])
+    r_points['DLend'][0] += end_m * 2
+
+    r_points['DB'] = list(r_points['D'])
+    r_points['DB'][2] = r_points['B'][2] + edg_m
+    r_points['DBmid'] = list(r_points['DB'])
+    r_points['DBmid'][2] *= mid_c
+    r_points['DBend'] = list(r_points['DB'])
+    r_points['DBend'][2] += end_m
+
+    # Left side
+    r_points['LU'] = list(r_points['L'])
+    r_points['LU'][1] = r_points['U'][1] - edg_m
+    r_points['LU'][0] = 0 - (x_edge + x_pos_m)
+    r_points['LUmid'] = list(r_points['L'])
+    r_points['LUmid'][1] += y_pos / 4
+    r_points['LUmid'][0] += (r_points['LU'][0]  - r_points['L'][0]) / 2
+    r_points['LUend'] = list(r_points['LU'])
+    r_points['LUend'][1] -= end_m
+    r_points['LUend'][0] -= x_pos_m
+
+    r_points['LD'] = list(r_points['L'])
+    r_points['LD'][1] = r_points['D'][1] + edg_m
+    r_points['LD'][0] = 0 - (x_edge + x_pos_m)
+    r_points['LDmid'] = list(r_points['L'])
+    r_points['LDmid'][1] -= y_pos / 3
+    r_points['LDend'] = list(r_points['LD'])
+    r_points['LDend'][1] += end_m
+    r_points['LDend'][0] -= x_pos_m
+
+    r_points['LB'] = list(r_points['L'])
+    r_points['LB'][2] = r_points['B'][2] + edg_m
+    r_points['LBmid'] = list(r_points['LB'])
+    r_points['LBmid'][2] *= mid_c
+    r_points['LBend'] = list(r_points['LB'])
+    r_points['LBend'][2] += end_m
+
+    # Back side
+    r_points['BU'] = list(r_points['B'])
+    r_points['BU'][1] = r_points['U'][1] - edg_m
+    r_points['BUmid'] = list(r_points['BU'])
+    r_points['BUmid'][1] -= y_pos / 4
+    r_points['BUend'] = list(r_points['BU'])
+    r_points['BUend'][1] -= end_m
+
+    r_points['BD'] = list(r_points['B'])
+    r_points['BD'][1] = r_points['D'][1] + edg_m
+    r_points['BDmid'] = list(r_points['BD'])
+    r_points['BDmid'][1] += y_pos / 4
+    r_points['BDend'] = list(r_points['BD'])
+    r_points['BDend'][1] += end_m
+
+    r_points['BL'] = list(r_points['B'])
+    r_points['BL'][0] = r_points['L'][0] + edg_m
+    r_points['BLmid'] = list(r_points['BL'])
+    r_points['BLmid'][0] *= mid_c
+    r_points['BLend'] = list(r_points['BL'])
+    r_points['BLend'][0] += end_m
+
+    # Right and front sides mirror the left and back sides. FR, FRmid and
+    # FRend now mirror BR; they used to take x from R.y (a typo). No ribbon
+    # curve reads them, so the ribbon itself is unchanged.
+    for key in [k for k in r_points if 'L' in k]:
+        x, y, z = r_points[key]
+        r_points[key.replace('L', 'R')] = [0 - x, y, z]
+    for key in [k for k in r_points if 'B' in k]:
+        x, y, z = r_points[key]
+        r_points[key.replace('B', 'F')] = [x, y, 0 - z]
+
+    # Bow
+
+    loop_w = side_w / 3
+    loop_h = side_w / 4
+
+    # Left loop
+    r_points['bow_L1'] = list(r_points['U'])
+    r_points['bow_L2'] = list(r_points['U'])
+    r_points['bow_L2'][0] = 0 - loop_w
+    r_points['bow_L2'][1] += r_thickness
+    r_points['bow_L3'] = list(r_points['bow_L2'])
+    r_points['bow_L3'][1] += loop_h / 2
+    r_points['bow_L3'][0] -= r_width / 2
+    r_points['bow_L4'] = list(r_points['bow_L2'])
+    r_points['bow_L4'][1] += loop_h
+    r_points['bow_L4'][0] += r_width * 0.25
+    r_points['bow_L5'] = list(r_points['bow_L1'])
+    r_points['bow_L5'][1] += r_thickness
+    r_points['bow_L5'][0] -= r_width * 0.85
+    r_points['bow_L6'] = list(r_points['bow_L5'])
+    r_points['bow_L6'][0] += r_width / 2
+    r_points['bow_L7'] = list(r_points['bow_L1'])
+    r_points['bow_L7'][1] += r_thickness * 0.5
+
+    # Right loop
+    r_points['bow_R1'] = list(r_points['U'])
+    r_points['bow_R2'] = list(r_points['U'])
+    r_points['bow_R2'][0] = loop_w
+    r_points['bow_R2'][1] += r_thickness
+    r_points['bow_R3'] = list(r_points['bow_R2'])
+    r_points['bow_R3'][1] += loop_h / 2
+    r_points['bow_R3'][0] += r_width / 2
+    r_points['bow_R4'] = list(r_points['bow_R2'])
+    r_points['bow_R4'][1] += loop_h
+    r_points['bow_R4'][0] -= r_width * 0.25
+    r_points['bow_R5'] = list(r_points['bow_R1'])
+    r_points['bow_R5'][1] += r_thickness
+    r_points['bow_R5'][0] += r_width * 0.85
+    r_points['bow_R6'] = list(r_points['bow_R5'])
+    r_points['bow_R6'][0] -= r_width / 2
+    r_points['bow_R7'] = list(r_points['bow_R1'])
+    r_points['bow_R7'][1] += r_thickness * 0.5
+
+    # Knot
+    r_points['knot_1'] = list(r_points['U'])
+    r_points['knot_1'][2] += r_width / 2
+    r_points['knot_2'] = list(r_points['knot_1'])
+    r_points['knot_2'][1] += r_thickness * 2
+    r_points['knot_3'] = list(r_points['U'])
+    r_points['knot_3'][1] += r_thickness * 2
+    r_points['knot_4'] = list(r_points['knot_2'])
+    r_points['knot_4'][2] -= r_width*1.5
+    r_points['knot_4'][1] += r_width*0.15
+    r_points['knot_5'] = list(r_points['U'])
+    r_points['knot_5'][2] -= r_width / 2
+
+    # Ends
+    # Left end
+    r_points['end_L1'] = list(r_points['U'])
+    r_points['end_L1'][2] += r_width / 2
+
+    return r_points
 
 def windowUI():
     win_w = 300
     col_1_w = 100
     col_2_w = 35
     col_3_w = win_w - (col_1_w + col_2_w)-25
-    colx4 = win_w / 4
+    colx4 = win_w // 4 # Widths stay ints on Python 3
+    cw4 = (colx4, colx4, colx4-5, colx4) # 4 column rows
     
-    my_window = pm.window(t="Gift Generator", rtf=True, w=win_w)
+    win_name = 'giftWrapWindow'
+    if pm.window(win_name, exists=True):
+        pm.deleteUI(win_name) # Rebuilt, callbacks of an old one point at the previous import
+    my_window = pm.window(win_name, t="Gift Generator", rtf=True, w=win_w)
     main_layout = pm.columnLayout(rs=10)
     with main_layout:
         wrap_frame = pm.frameLayout(l='Wrap Gift', bs='etchedIn',
@@ -2049,41 +1671,23 @@ def windowUI():
         with wrap_frame:
             wrap_layout = pm.columnLayout()
             with wrap_layout:
-                wrap_row_size = pm.rowLayout(nc=4, cw4=(colx4,colx4,colx4-5,colx4))
+                wrap_row_size = pm.rowLayout(nc=4, cw4=cw4)
                 with wrap_row_size:
                     pm.text(' Paper weight:')
                     wrap_sld_thk = pm.floatSliderGrp(min=0.005, max=0.05, value=0.02)
 
                     pm.text('Ribbon size:')
-                    wrap_opt_menu_r_size = pm.optionMenu()
-                    with wrap_opt_menu_r_size:
-                        pm.menuItem( label='Large' )
-                        pm.menuItem( label='Medium' )
-                        pm.menuItem( label='Small' )                        
+                    wrap_opt_menu_r_size = createOptionMenu(('Large', 'Medium', 'Small'))
 
-                wrap_row_color = pm.rowLayout(nc=4, cw4=(colx4,colx4,colx4-5,colx4))
+                wrap_row_color = pm.rowLayout(nc=4, cw4=cw4)
                 with wrap_row_color:
                     pm.text(' Paper color:')
-                    wrap_opt_menu_p_color = pm.optionMenu()
-                    with wrap_opt_menu_p_color:
-                        pm.menuItem( label='Random' )
-                        pm.menuItem( label='Red' )
-                        pm.menuItem( label='Green' )
-                        pm.menuItem( label='Blue' )
-                        pm.menuItem( label='Yellow' )
-                        pm.menuItem( label='Black' )
-                        pm.menuItem( label='White' )
+                    wrap_opt_menu_p_color = createOptionMenu(paper_color_labels)
                     pm.text('Ribbon color:')
-                    wrap_opt_menu_r_color = pm.optionMenu()
-                    with wrap_opt_menu_r_color:
-                        pm.menuItem( label='Random' )
-                        pm.menuItem( label='Red' )
-                        pm.menuItem( label='Green' )
-                        pm.menuItem( label='Blue' )
-                        pm.menuItem( label='Yellow' )
+                    wrap_opt_menu_r_color = createOptionMenu(ribbon_color_labels)
                 pm.separator(h=10, w=win_w, style='in')
                 pm.text(" Animation", font='smallBoldLabelFont')
-                wrap_row_anim = pm.rowLayout(nc=4, cw4=(colx4,colx4,colx4-5,colx4))
+                wrap_row_anim = pm.rowLayout(nc=4, cw4=cw4)
                 with wrap_row_anim:
                     pm.text('Start frame:', w=colx4, align='right')
                     wrap_int_anim_s = pm.intField(min=0, w=45, v=1)
@@ -2091,7 +1695,7 @@ def windowUI():
                     wrap_int_anim_e = pm.intField(min=0, w=45, v=24)
                 pm.separator(h=10, w=win_w, style='in')
 
-                wrap_row_btn = pm.rowLayout(nc=2, cw2=(win_w /2 - 30, win_w /2 - 30))
+                wrap_row_btn = pm.rowLayout(nc=2, cw2=(win_w // 2 - 30, win_w // 2 - 30))
                 with wrap_row_btn:
                     pm.text('')
                     wrap_btn_run = pm.button(l='Wrap', w=60)
@@ -2105,7 +1709,7 @@ def windowUI():
         with mod_frame:
             mod_layout = pm.columnLayout()
             with mod_layout:
-                mod_row_scan_btn = pm.rowLayout(nc=3, cw3=(15, win_w /2 -15, win_w /2 - 10))
+                mod_row_scan_btn = pm.rowLayout(nc=3, cw3=(15, win_w // 2 - 15, win_w // 2 - 10))
                 with mod_row_scan_btn:
                     pm.text('')
                     mod_btn_scan_sel = pm.button(l='Scan selection', w=120)
@@ -2130,24 +1734,8 @@ def windowUI():
                     pm.text(' ')
                 mod_row_color = pm.rowLayout(nc=3, cw3=(100,100,80))
                 with mod_row_color:
-                    mod_opt_menu_p_color = pm.optionMenu()
-                    with mod_opt_menu_p_color:
-                        pm.menuItem( label='Random' )
-                        pm.menuItem( label='Red' )
-                        pm.menuItem( label='Green' )
-                        pm.menuItem( label='Blue' )
-                        pm.menuItem( label='Yellow' )
-                        pm.menuItem( label='Black' )
-                        pm.menuItem( label='White' )
-                        pm.menuItem( label='Current' )
-                    mod_opt_menu_r_color = pm.optionMenu()
-                    with mod_opt_menu_r_color:
-                        pm.menuItem( label='Random' )
-                        pm.menuItem( label='Red' )
-                        pm.menuItem( label='Green' )
-                        pm.menuItem( label='Blue' )
-                        pm.menuItem( label='Yellow' )
-                        pm.menuItem( label='Current' )
+                    mod_opt_menu_p_color = createOptionMenu(paper_color_labels + ('Current',))
+                    mod_opt_menu_r_color = createOptionMenu(ribbon_color_labels + ('Current',))
                     mod_btn_color = pm.button(l='Edit', w=80)
                 pm.separator(h=10, w=win_w, style='in')
                 pm.text(' Ribbon size:', font='tinyBoldLabelFont')
@@ -2167,155 +1755,149 @@ def windowUI():
                     mod_int_anim_e = pm.intField(min=0, w=45, v=24)
                     mod_btn_anim = pm.button(l='Edit', w=80)
 
-    wrap_btn_run.setCommand(pm.Callback(runWrap, wrap_sld_thk, wrap_opt_menu_p_color,
-                            wrap_opt_menu_r_size, wrap_opt_menu_r_color, wrap_int_anim_s,
-                            wrap_int_anim_e))
-    mod_btn_scan_sel.setCommand(pm.Callback(scanForWraps, mod_txt_list, True))
-    mod_btn_scan_scn.setCommand(pm.Callback(scanForWraps, mod_txt_list, False))
-    mod_btn_pweight.setCommand(pm.Callback(editPaperWeight, mod_txt_list, mod_sld_thk))
-    mod_btn_color.setCommand(pm.Callback(editColors, mod_txt_list, mod_opt_menu_p_color, mod_opt_menu_r_color))
-    mod_btn_r_sz.setCommand(pm.Callback(editRibbonSize, mod_txt_list, mod_radio_r_sz))
-    mod_btn_anim.setCommand(pm.Callback(editAnimation, mod_txt_list, mod_int_anim_s, mod_int_anim_e))
-    mod_txt_list.selectCommand(pm.Callback(deselectHeader, mod_txt_list))
+    # Callbacks get widget names, the functions query them with maya.cmds
+    wrap_btn_run.setCommand(pm.Callback(runWrap, str(wrap_sld_thk), str(wrap_opt_menu_p_color),
+                            str(wrap_opt_menu_r_size), str(wrap_opt_menu_r_color), str(wrap_int_anim_s),
+                            str(wrap_int_anim_e)))
+    mod_btn_scan_sel.setCommand(pm.Callback(scanForWraps, str(mod_txt_list), True))
+    mod_btn_scan_scn.setCommand(pm.Callback(scanForWraps, str(mod_txt_list), False))
+    mod_btn_pweight.setCommand(pm.Callback(editPaperWeight, str(mod_txt_list), str(mod_sld_thk)))
+    mod_btn_color.setCommand(pm.Callback(editColors, str(mod_txt_list), str(mod_opt_menu_p_color), str(mod_opt_menu_r_color)))
+    mod_btn_r_sz.setCommand(pm.Callback(editRibbonSize, str(mod_txt_list), str(mod_radio_r_sz)))
+    mod_btn_anim.setCommand(pm.Callback(editAnimation, str(mod_txt_list), str(mod_int_anim_s), str(mod_int_anim_e)))
+    mod_txt_list.selectCommand(pm.Callback(deselectHeader, str(mod_txt_list)))
 
     my_window.show()
 
+def createOptionMenu(labels):
+    """Option menu with one item per label"""
+    menu = pm.optionMenu()
+    with menu:
+        for label in labels:
+            pm.menuItem(label=label)
+    return menu
+
 def deselectHeader(txt_list):
-    txt_list.deselectIndexedItem([1,2])
+    mc.textScrollList(txt_list, edit=True, deselectIndexedItem=[1,2])
 
 def runWrap(p_thk, p_clr, r_sz, r_clr, an_s, an_e):
-    paper_thickness = p_thk.getValue()
-    paper_color = p_clr.getValue().lower()
-    ribbon_size = r_sz.getValue()[0]
-    ribbon_color = r_clr.getValue().lower()
-    animation_start = an_s.getValue()
-    animation_end = an_e.getValue()
+    paper_thickness = mc.floatSliderGrp(p_thk, q=True, value=True)
+    paper_color = mc.optionMenu(p_clr, q=True, value=True).lower()
+    ribbon_size = mc.optionMenu(r_sz, q=True, value=True)[0]
+    ribbon_color = mc.optionMenu(r_clr, q=True, value=True).lower()
+    animation_start = mc.intField(an_s, q=True, value=True)
+    animation_end = mc.intField(an_e, q=True, value=True)
 
     objects = pm.selected()
-    for o in objects[:32]:
-        gift = GiftWrap(o, 'create', ribbon_size, paper_thickness, paper_color, ribbon_color, animation_start, animation_end)
+    with suspendScene(): # All wraps build and undo in one go
+        for o in objects[:32]:
+            gift = GiftWrap(o, 'create', ribbon_size, paper_thickness, paper_color, ribbon_color, animation_start, animation_end)
 
 def scanForWraps(txt_list, scan_mode, selection=None):
-    global wrap_list
+    global wrap_list, wrap_gifts
     if selection is None:
-        wrap_list = pm.ls(regex='^.*_gift_wrap_[0-9A-Z]{5}_GRP\|CTRL_gift_[0-9A-Z]{5}$',
-                          type='transform', sl=scan_mode)
-
-    txt_list.removeAll()
-
-    # Titles
-    col1_title = addPadding('Object', 1)
-    col2_title = addPadding('ID', 2)
-    col3_title = addPadding('P. Weight', 3)
-    col4_title = addPadding('P. Color', 4)
-    col5_title = addPadding('R. Color', 5)
-    col6_title = addPadding('R. Size', 6)
-    col7_title = addPadding('Animation', 7)
+        # Plain names, GiftWrap loads them itself
+        wrap_list = [node for node in mc.ls(type='transform', sl=scan_mode, long=True)
+                     if wrap_ctrl_pattern.match(node)]
+        wrap_gifts = [GiftWrap(w, 'load') for w in wrap_list]
 
+    mc.textScrollList(txt_list, edit=True, removeAll=True)
 
     if len(wrap_list) > 0:
-        titles = col1_title + col2_title + col3_title + col4_title
-        titles += col5_title + col6_title +col7_title
-        txt_list.append(titles)
-        txt_list.append(addPadding('-',0))
-        for w in wrap_list:
-            wrap = GiftWrap(w,'load')
-
-            wrap_name = addPadding(wrap.wrap_name, 1)
-            wrap_id = addPadding(wrap.wrap_id, 2)
-            paper_thickness = addPadding(str(wrap.wrap_thickness), 3)
-            paper_color = addPadding(wrap.wrap_color, 4)
-            ribbon_color = addPadding(wrap.ribbon_color, 5)
-            ribbon_size = addPadding(wrap.ribbon_size, 6)
-            animation = addPadding(str(wrap.animation_start) + ' - ' + str(wrap.animation_end), 7)
-
-            attributes = wrap_name + wrap_id + paper_thickness
-            attributes += paper_color + ribbon_color + ribbon_size
-            attributes += animation
-            txt_list.append(attributes)
-
+        titles = row_format % ('Object', 'ID', 'P. Weight', 'P. Color', 'R. Color', 'R. Size', 'Animation')
+        rows = [titles, addPadding('-',0)]
+        for wrap in wrap_gifts:
+            animation = '%s - %s' % (wrap.animation_start, wrap.animation_end)
+            rows.append(row_format % (wrap.wrap_name, wrap.wrap_id, wrap.wrap_thickness, wrap.wrap_color,
+                                      wrap.ribbon_color, wrap.ribbon_size, animation))
+        pm.textScrollList(txt_list, append=rows, edit=True) # All rows in one edit
+
+        # Rows are 1-based, wraps start after the title and separator rows
         if selection is None:
-            num_items = txt_list.getNumberOfItems()+1
-            for i in range(3, num_items):
-                pm.textScrollList(txt_list, selectIndexedItem=i, edit=True)
+            selected = list(range(3, len(rows)+1))
         else:
-            for s in selection:
-                pm.textScrollList(txt_list, selectIndexedItem=s+3, edit=True)
+            selected = [s+3 for s in selection]
+        if selected:
+            pm.textScrollList(txt_list, selectIndexedItem=selected, edit=True)
     else:
-        txt_list.append('None found')
-        txt_list.append(addPadding(' ',0))
+        pm.textScrollList(txt_list, append=['None found', addPadding(' ',0)], edit=True)
 
 def addPadding(text, column):
     """
     Add spaces to the given text in order to
     align it properly in the scroll list.
     """
-    # Column length
-    col_len = [0] # 0
-    col_len.append(18) # 1
-    col_len.append(8)
-    col_len.append(10)
-    col_len.append(10)
-    col_len.append(10)
-    col_len.append(10)
-    col_len.append(10) # 7
-
     if column == 0:
         return text[:1] * ( sum(col_len) + 7)
     else:
-        text = text[:col_len[column]]
-        padding = col_len[column] - len(text)
-        text += ' ' * (padding+1)
+        return '%-*.*s' % (col_len[column] + 1, col_len[column], text)
 
-        return text
+def getScannedWrap(index):
+    """
+    Get a wrap loaded by scanForWraps, its stored values are read again
+    in case of undos. Loads it again if any of its nodes are gone or its
+    CTRL handle is no longer the one in wrap_list, e.g. after undoing a reload.
+    """
+    gift = wrap_gifts[index]
+    if type(gift.ribbons) is dict:
+        ribbon = [r[1][0] for r in gift.ribbons.values()]
+    else:
+        ribbon = list(gift.ribbons)
+    nodes = [gift.ctrl_handle[0], gift.main_group, gift.wrap_gift, gift.wrap_paper[0]] + ribbon + list(gift.ribbon_prof)
+    if all([node.exists() for node in nodes]) and gift.ctrl_handle[0].longName() == wrap_list[index]:
+        gift.retrieveCtrlValues()
+    else:
+        gift = wrap_gifts[index] = GiftWrap(wrap_list[index], 'load')
+    return gift
 
 def editPaperWeight(txt_list, p_weight):
     selection = removeHeader(txt_list)
-    wrap_thickness = p_weight.getValue()
+    wrap_thickness = mc.floatSliderGrp(p_weight, q=True, value=True)
     if selection is not None:
-        for s in selection:
-            edit_gift = GiftWrap(wrap_list[s], 'load')
-            edit_gift.wrap_thickness = wrap_thickness
-            edit_gift.reloadGiftWrap()
-            wrap_list[s] = edit_gift.ctrl_handle[0] # Replace the old gift
+        with suspendScene(): # One redraw and undo step for the whole batch
+            for s in selection:
+                edit_gift = getScannedWrap(s)
+                edit_gift.wrap_thickness = wrap_thickness
+                edit_gift.reloadGiftWrap()
+                wrap_list[s] = edit_gift.ctrl_handle[0].longName() # Replace the old gift
         scanForWraps(txt_list, 0, selection) # Refresh scroll list
 
 def editColors(txt_list, p_color, r_color):
  
     selection = removeHeader(txt_list)
-    wrap_color = p_color.getValue().lower()
-    ribbon_color = r_color.getValue().lower()
+    wrap_color = mc.optionMenu(p_color, q=True, value=True).lower()
+    ribbon_color = mc.optionMenu(r_color, q=True, value=True).lower()
     if selection is not None:
-        for s in selection:
-            edit_gift = GiftWrap(wrap_list[s], 'load')
-            edit_gift.newColor(wrap_color, ribbon_color)
+        with suspendScene():
+            for s in selection:
+                edit_gift = getScannedWrap(s)
+                edit_gift.newColor(wrap_color, ribbon_color)
         scanForWraps(txt_list, 0, selection) # Refresh scroll list
 
 def editRibbonSize(txt_list, r_size):
     selection = removeHeader(txt_list)
-    r_size = r_size.getSelect()
-    if r_size == 1:
-        ribbon_size = 'S'
-    elif r_size == 2:
-        ribbon_size = 'M'
-    elif r_size == 3:
-        ribbon_size = 'L'
+    r_size = mc.radioButtonGrp(r_size, q=True, select=True)
+    if not r_size in (1, 2, 3): # Nothing selected
+        return
+    ribbon_size = ('S', 'M', 'L')[r_size - 1] # Order of the radio buttons
 
     if selection is not None:
-        for s in selection:
-            edit_gift = GiftWrap(wrap_list[s], 'load')
-            edit_gift.changeRibbon(ribbon_size)
+        with suspendScene():
+            for s in selection:
+                edit_gift = getScannedWrap(s)
+                edit_gift.changeRibbon(ribbon_size)
         scanForWraps(txt_list, 0, selection) # Refresh scroll list
 
 def editAnimation(txt_list, anim_s, anim_e):
     selection = removeHeader(txt_list)
-    animation_start = anim_s.getValue()
-    animation_end = anim_e.getValue()
+    animation_start = mc.intField(anim_s, q=True, value=True)
+    animation_end = mc.intField(anim_e, q=True, value=True)
 
     if selection is not None:
-        for s in selection:
-            edit_gift = GiftWrap(wrap_list[s], 'load')
-            edit_gift.setAnimation(animation_start, animation_end)
+        with suspendScene():
+            for s in selection:
+                edit_gift = getScannedWrap(s)
+                edit_gift.setAnimation(animation_start, animation_end)
         scanForWraps(txt_list, 0, selection) # Refresh scroll list
 
 def removeHeader(txt_list):
@@ -2325,143 +1907,37 @@ def removeHeader(txt_list):
     """
     hdr_rows = 2 # Number of header rows
     
-    items = txt_list.getSelectIndexedItem()
-    if items == []:
+    items = mc.textScrollList(txt_list, q=True, selectIndexedItem=True)
+    if not items: # None when nothing is selected
         return None
     else:
-        gifts = [( (hdr_rows + 1) * -1 ) + item for item in items]
-        return gifts
+        offset = (hdr_rows + 1) * -1 # Rows are 1-based
+        return [offset + item for item in items]
 
 
-def createShaders():
+def createShaders(names):
     """
-    These shaders are used for coloring the generated geometry
+    These shaders are used for coloring the generated geometry, created on
+    demand by applyColor so only the colors in use end up in the scene.
+    names = shaders to create if missing, e.g. 'paper_RED'
     """
-    # Ribbon Materials
-    # Green Material
-    rg_name = 'ribbon_GREEN'
-    if not pm.objExists("mat_" + rg_name):
-        mat_ribbon_green = pm.shadingNode("blinn", asShader=True, name ="mat_" + rg_name)
-        mat_ribbon_green.color.set([0.1,0.6,0.1])
-        mat_ribbon_green.eccentricity.set(0.6)
-        mat_ribbon_green.specularRollOff.set(0.7)
-    # Green Shader
-    if not pm.objExists("shd_" + rg_name):
-        shd_ribbon_green = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + rg_name)
-        # Connect material to shader
-        mat_ribbon_green.outColor >> shd_ribbon_green.surfaceShader
-
-    # Red Material
-    rr_name = 'ribbon_RED'
-    if not pm.objExists("mat_" + rr_name):
-        mat_ribbon_red = pm.shadingNode("blinn", asShader=True, name ="mat_" + rr_name)
-        mat_ribbon_red.color.set([0.6,0.1,0.1])
-        mat_ribbon_red.eccentricity.set(0.6)
-        mat_ribbon_red.specularRollOff.set(0.7)
-    # Red Shader
-    if not pm.objExists("shd_" + rr_name):
-        shd_ribbon_red = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + rr_name)
-        # Connect material to shader
-        mat_ribbon_red.outColor >> shd_ribbon_red.surfaceShader
-
-    # Blue Material
-    rb_name = 'ribbon_BLUE'
-    if not pm.objExists("mat_" + rb_name):
-        mat_ribbon_blue = pm.shadingNode("blinn", asShader=True, name ="mat_" + rb_name)
-        mat_ribbon_blue.color.set([0.1,0.1,0.6])
-        mat_ribbon_blue.eccentricity.set(0.6)
-        mat_ribbon_blue.specularRollOff.set(0.7)
-    # Green Shader
-    if not pm.objExists("shd_" + rb_name):
-        shd_ribbon_blue = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + rb_name)
-        # Connect material to shader
-        mat_ribbon_blue.outColor >> shd_ribbon_blue.surfaceShader
-
-    # Yellow Material
-    ry_name = 'ribbon_YELLOW'
-    if not pm.objExists("mat_" + ry_name):
-        mat_ribbon_yellow = pm.shadingNode("blinn", asShader=True, name ="mat_" + ry_name)
-        mat_ribbon_yellow.color.set([0.8,0.7,0.1])
-        mat_ribbon_yellow.eccentricity.set(0.6)
-        mat_ribbon_yellow.specularRollOff.set(0.7)
-    # Green Shader
-    if not pm.objExists("shd_" + ry_name):
-        shd_ribbon_yellow = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + ry_name)
-        # Connect material to shader
-        mat_ribbon_yellow.outColor >> shd_ribbon_yellow.surfaceShader
-
-    # Paper Materials
-    # Green Material
-    pg_name = 'paper_GREEN'
-    if not pm.objExists("mat_" + pg_name):
-        mat_paper_green = pm.shadingNode("lambert", asShader=True, name ="mat_" + pg_name)
-        mat_paper_green.color.set([0.2,0.6,0.2])
-        mat_paper_green.diffuse.set(1)
-    # Green Shader
-    if not pm.objExists("shd_" + pg_name):
-        shd_paper_green = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + pg_name)
-        # Connect material to shader
-        mat_paper_green.outColor >> shd_paper_green.surfaceShader
-
-    # Red Material
-    pr_name = 'paper_RED'
-    if not pm.objExists("mat_" + pr_name):
-        mat_paper_red = pm.shadingNode("lambert", asShader=True, name ="mat_" + pr_name)
-        mat_paper_red.color.set([0.8,0.3,0.3])
-        mat_paper_red.diffuse.set(1)
-    # Red Shader
-    if not pm.objExists("shd_" + pr_name):
-        shd_paper_red = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + pr_name)
-        # Connect material to shader
-        mat_paper_red.outColor >> shd_paper_red.surfaceShader
-
-    # Blue Material
-    pb_name = 'paper_BLUE'
-    if not pm.objExists("mat_" + pb_name):
-        mat_paper_blue = pm.shadingNode("lambert", asShader=True, name ="mat_" + pb_name)
-        mat_paper_blue.color.set([0.3,0.3,0.8])
-        mat_paper_blue.diffuse.set(1)
-    # Green Shader
-    if not pm.objExists("shd_" + pb_name):
-        shd_paper_blue = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + pb_name)
-        # Connect material to shader
-        mat_paper_blue.outColor >> shd_paper_blue.surfaceShader
-
-    # Yellow Material
-    py_name = 'paper_YELLOW'
-    if not pm.objExists("mat_" + py_name):
-        mat_paper_yellow = pm.shadingNode("lambert", asShader=True, name ="mat_" + py_name)
-        mat_paper_yellow.color.set([0.8,0.75,0.3])
-        mat_paper_yellow.diffuse.set(1)
-    # Yellow Shader
-    if not pm.objExists("shd_" + py_name):
-        shd_paper_yellow = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + py_name)
-        # Connect material to shader
-        mat_paper_yellow.outColor >> shd_paper_yellow.surfaceShader
-
-    # White Material
-    pw_name = 'paper_WHITE'
-    if not pm.objExists("mat_" + pw_name):
-        mat_paper_white = pm.shadingNode("lambert", asShader=True, name ="mat_" + pw_name)
-        mat_paper_white.color.set([0.98,0.98,0.98])
-        mat_paper_white.diffuse.set(1)
-    # White Shader
-    if not pm.objExists("shd_" + pw_name):
-        shd_paper_white = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + pw_name)
-        # Connect material to shader
-        mat_paper_white.outColor >> shd_paper_white.surfaceShader
-
-    # Black Material
-    pbl_name = 'paper_BLACK'
-    if not pm.objExists("mat_" + pbl_name):
-        mat_paper_black = pm.shadingNode("lambert", asShader=True, name ="mat_" + pbl_name)
-        mat_paper_black.color.set([0.1,0.1,0.1])
-        mat_paper_black.diffuse.set(1)
-    # Black Shader
-    if not pm.objExists("shd_" + pbl_name):
-        shd_paper_black = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="shd_" + pbl_name)
+    shader_nodes = ['mat_' + name for name in names] + ['shd_' + name for name in names]
+    existing = set(mc.ls(shader_nodes)) # One scene query for all of them
+    for name, mat_type, color in shader_list:
+        if not name in names:
+            continue
+        mat_name = 'mat_' + name
+        shd_name = 'shd_' + name
+        if mat_name in existing and shd_name in existing:
+            continue
+        if not mat_name in existing:
+            mc.shadingNode(mat_type, asShader=True, name=mat_name)
+            mc.setAttr('%s.color' % (mat_name,), color[0], color[1], color[2], type='double3')
+            for attr, value in shader_attrs[mat_type]:
+                mc.setAttr('%s.%s' % (mat_name, attr), value)
+        if not shd_name in existing:
+            mc.sets(renderable=True, noSurfaceShader=True, empty=True, name=shd_name)
         # Connect material to shader
-        mat_paper_black.outColor >> shd_paper_black.surfaceShader
+        mc.connectAttr('%s.outColor' % (mat_name,), '%s.surfaceShader' % (shd_name,), force=True)
 
-createShaders()
 windowUI()